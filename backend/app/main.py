@@ -4,10 +4,15 @@ load_dotenv()
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.routers import upload, imports, ai, export, salesmap, admin
 
-app = FastAPI(title="Salesmap 데이터 가져오기 API", version="1.0.0")
+app = FastAPI(
+    title="Salesmap 데이터 가져오기 API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Get allowed origins from environment variable, fallback to localhost for development
 allowed_origins_env = os.getenv("ALLOWED_ORIGINS", "http://localhost:5173")
@@ -17,8 +22,17 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "OPTIONS"],
+    allow_headers=[
+        "Authorization",
+        "Content-Type",
+        "Accept",
+        "X-Admin-Password",
+        "X-Salesmap-Api-Key",
+        "X-Import-Session-Id",
+        "X-Import-Row-Index",
+    ],
+    max_age=86400,
 )
 
 app.include_router(upload.router, prefix="/api", tags=["upload"])
@@ -2,6 +2,7 @@
 세일즈맵 상수 및 필드 정의
 오브젝트별 시스템 필드, 필수 조건, 유효성 규칙
 """
+import re
 from typing import Optional
 from dataclasses import dataclass, field
 
@@ -49,24 +50,24 @@ OBJECT_DESCRIPTIONS = {
 
 # 필수 필드 (반드시 값이 있어야 함)
 REQUIRED_FIELDS = {
-    "people": ["name"],  # 이름 필수
-    "company": ["name"],  # 회사명 필수
-    "deal": ["name", "pipeline"],  # 딜 이름, 파이프라인 필수
-    "lead": ["name"],  # 리드 이름 필수
+    "people": frozenset({"name"}),  # 이름 필수
+    "company": frozenset({"name"}),  # 회사명 필수
+    "deal": frozenset({"name", "pipeline"}),  # 딜 이름, 파이프라인 필수
+    "lead": frozenset({"name"}),  # 리드 이름 필수
 }
 
 # 유니크 필드 (중복 불가)
 UNIQUE_FIELDS = {
-    "people": ["email"],  # 이메일은 고유해야 함
-    "company": [],
-    "deal": [],
-    "lead": ["email"],  # 리드 이메일도 고유
+    "people": frozenset({"email"}),  # 이메일은 고유해야 함
+    "company": frozenset(),
+    "deal": frozenset(),
+    "lead": frozenset({"email"}),  # 리드 이메일도 고유
 }
 
 # 연결 필수 조건
 CONNECTION_REQUIREMENTS = {
-    "deal": ["people", "company"],  # 딜은 고객 또는 회사와 연결 필요
-    "lead": ["people", "company"],  # 리드도 고객 또는 회사와 연결 필요
+    "deal": frozenset({"people", "company"}),  # 딜은 고객 또는 회사와 연결 필요
+    "lead": frozenset({"people", "company"}),  # 리드도 고객 또는 회사와 연결 필요
 }
 
 
@@ -74,7 +75,7 @@ CONNECTION_REQUIREMENTS = {
 # 시스템 필드 정의
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SystemField:
     """시스템 필드 정보"""
     id: str
@@ -162,25 +163,50 @@ SYSTEM_FIELDS = {
     "lead": LEAD_SYSTEM_FIELDS,
 }
 
+# 오브젝트별 ID/라벨 인덱스 (find_system_field 조회용)
+_SYSTEM_FIELDS_BY_ID: dict[str, dict[str, SystemField]] = {
+    obj: {f.id: f for f in fields} for obj, fields in SYSTEM_FIELDS.items()
+}
+_SYSTEM_FIELDS_BY_LABEL: dict[str, dict[str, SystemField]] = {
+    obj: {f.label: f for f in fields} for obj, fields in SYSTEM_FIELDS.items()
+}
+
 
 # ============================================================================
 # 필드 타입별 검증 규칙
 # ============================================================================
 
+# email은 정규식 대신 _email_valid로 검증 (match_field_type 참고)
 FIELD_TYPE_PATTERNS = {
-    "email": r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',
-    "phone": r'^[\d\-\+\(\)\s]+$',
-    "url": r'^https?://[^\s]+$',
-    "number": r'^-?\d+\.?\d*$',
-    "date": r'^\d{4}-\d{2}-\d{2}$',
-    "datetime": r'^\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}',
+    "phone": re.compile(r'^[\d\-\+\(\)\s]+$', re.ASCII),
+    "url": re.compile(r'^https?://[^\s]+$', re.ASCII),
+    "number": re.compile(r'^-?\d+\.?\d*$', re.ASCII),
+    "date": re.compile(r'^\d{4}-\d{2}-\d{2}$', re.ASCII),
+    "datetime": re.compile(r'^\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}', re.ASCII),
 }
 
+# 이메일은 구조 검사 후 로컬/도메인 부분을 각각 검증 (백트래킹 방지)
+_EMAIL_LOCAL_RE = re.compile(r'[a-zA-Z0-9._%+-]+', re.ASCII)
+_EMAIL_DOMAIN_RE = re.compile(r'(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}', re.ASCII)
+
+# 전화번호 정규화 시 제거할 문자 (숫자, +, - 외 전부)
+_PHONE_STRIP = re.compile(r'[^0-9+\-]')
+
+# 숫자 정규화 시 제거할 문자 (천 단위 구분자, 공백)
+_NUM_STRIP = str.maketrans('', '', ', ')
+
+
+def _norm_url(x) -> str:
+    """URL 정규화 (스킴이 없으면 https:// 추가)"""
+    s = str(x).strip()
+    return s if s.startswith(('http://', 'https://')) else 'https://' + s
+
+
 FIELD_TYPE_NORMALIZERS = {
-    "phone": lambda x: ''.join(c for c in str(x) if c.isdigit() or c in '+-'),
+    "phone": lambda x: _PHONE_STRIP.sub('', str(x)),
     "email": lambda x: str(x).lower().strip(),
-    "url": lambda x: str(x).strip() if str(x).startswith(('http://', 'https://')) else f'https://{str(x).strip()}',
-    "number": lambda x: float(str(x).replace(',', '').replace(' ', '')),
+    "url": _norm_url,
+    "number": lambda x: float(str(x).translate(_NUM_STRIP)),
     "date": lambda x: str(x)[:10] if len(str(x)) >= 10 else str(x),
 }
 
@@ -204,8 +230,11 @@ SKIP_COLUMN_PATTERNS = [
     r'^modified_?at$',
 ]
 
-# 빈 값으로 간주할 값들
-EMPTY_VALUES = ['', None, 'null', 'NULL', 'None', 'N/A', 'n/a', '-', '--']
+# 제외 패턴을 하나의 정규식으로 합쳐 컬럼당 한 번만 매칭
+SKIP_COLUMN_RE = re.compile('|'.join(f'(?:{p})' for p in SKIP_COLUMN_PATTERNS), re.IGNORECASE)
+
+# 빈 값으로 간주할 값들 (None은 is_value_empty에서 별도 처리)
+EMPTY_VALUES = frozenset(('', 'null', 'NULL', 'None', 'N/A', 'n/a', '-', '--'))
 
 # 최소 유지 비율 (40% - 핵심 필드만 유지해도 됨)
 MIN_KEEP_RATIO = 0.4
@@ -223,14 +252,14 @@ def get_system_fields(object_type: str) -> list[SystemField]:
     return SYSTEM_FIELDS.get(object_type, [])
 
 
-def get_required_fields(object_type: str) -> list[str]:
-    """오브젝트의 필수 필드 ID 목록 반환"""
-    return REQUIRED_FIELDS.get(object_type, [])
+def get_required_fields(object_type: str) -> frozenset[str]:
+    """오브젝트의 필수 필드 ID 집합 반환"""
+    return REQUIRED_FIELDS.get(object_type, frozenset())
 
 
-def get_unique_fields(object_type: str) -> list[str]:
-    """오브젝트의 유니크 필드 ID 목록 반환"""
-    return UNIQUE_FIELDS.get(object_type, [])
+def get_unique_fields(object_type: str) -> frozenset[str]:
+    """오브젝트의 유니크 필드 ID 집합 반환"""
+    return UNIQUE_FIELDS.get(object_type, frozenset())
 
 
 def get_object_name(object_type: str) -> str:
@@ -248,17 +277,53 @@ def korean_to_object_type(korean_name: str) -> str:
     return KOREAN_TO_OBJECT.get(korean_name, korean_name)
 
 
-def get_connection_requirements(object_type: str) -> list[str]:
+def get_connection_requirements(object_type: str) -> frozenset[str]:
     """오브젝트의 연결 필수 조건 반환"""
-    return CONNECTION_REQUIREMENTS.get(object_type, [])
+    return CONNECTION_REQUIREMENTS.get(object_type, frozenset())
 
 
 def is_value_empty(value) -> bool:
     """값이 빈 값인지 확인"""
     if value is None:
         return True
-    str_value = str(value).strip()
-    return str_value in EMPTY_VALUES or len(str_value) == 0
+    value_type = type(value)
+    # 숫자는 str() 변환 없이 판단 (NaN만 빈 값)
+    if value_type is int or value_type is bool:
+        return False
+    if value_type is float:
+        return value != value
+    str_value = (value if value_type is str else str(value)).strip()
+    return not str_value or str_value in EMPTY_VALUES
+
+
+def _email_valid(s: str) -> bool:
+    """이메일 형식 검증 (길이/@ 개수/점 위치를 먼저 확인한 뒤 정규식 적용)"""
+    if not 3 <= len(s) <= 254 or s.count('@') != 1:
+        return False
+    local, _, domain = s.partition('@')
+    if not local or not domain:
+        return False
+    if local[0] == '.' or local[-1] == '.' or domain[0] == '.' or domain[-1] == '.':
+        return False
+    return (
+        _EMAIL_LOCAL_RE.fullmatch(local) is not None
+        and _EMAIL_DOMAIN_RE.fullmatch(domain) is not None
+    )
+
+
+def is_skip_column_name(name: str) -> bool:
+    """컬럼명이 제외 패턴(내부 식별자 등)에 해당하는지 확인"""
+    return SKIP_COLUMN_RE.match(name) is not None
+
+
+def match_field_type(field_type: str, value: str) -> bool:
+    """값이 필드 타입의 패턴과 일치하는지 확인 (패턴이 없는 타입은 통과)"""
+    if field_type == "email":
+        return _email_valid(value)
+    pattern = FIELD_TYPE_PATTERNS.get(field_type)
+    if pattern is None:
+        return True
+    return pattern.match(value) is not None
 
 
 def format_field_label(object_type: str, field_name: str, use_english: bool = True) -> str:
@@ -281,16 +346,16 @@ def parse_field_label(label: str) -> tuple[Optional[str], str]:
     '오브젝트 - 필드명' 형식의 라벨을 파싱
     Returns: (object_name, field_name) 또는 (None, label)
     """
-    if ' - ' in label:
-        parts = label.split(' - ', 1)
-        return parts[0], parts[1]
-    return None, label
+    head, sep, tail = label.partition(' - ')
+    return (head, tail) if sep else (None, label)
 
 
 def find_system_field(object_type: str, field_id_or_label: str) -> Optional[SystemField]:
     """시스템 필드 찾기 (ID 또는 라벨로)"""
-    fields = get_system_fields(object_type)
-    for f in fields:
-        if f.id == field_id_or_label or f.label == field_id_or_label:
-            return f
-    return None
+    by_id = _SYSTEM_FIELDS_BY_ID.get(object_type)
+    if by_id is None:
+        return None
+    found = by_id.get(field_id_or_label)
+    if found is not None:
+        return found
+    return _SYSTEM_FIELDS_BY_LABEL[object_type].get(field_id_or_label)
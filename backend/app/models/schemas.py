@@ -2,8 +2,9 @@
 Pydantic 모델 정의 - Wrapper 아키텍처용 스키마
 LLM 응답 검증 및 데이터 구조 정의
 """
+from collections import Counter
 from typing import Optional, Literal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
 
@@ -54,6 +55,8 @@ class SkipReason(str, Enum):
 
 class ColumnStats(BaseModel):
     """컬럼 통계 정보"""
+    model_config = ConfigDict(frozen=True)
+
     column_name: str = Field(..., description="컬럼 이름")
     total_rows: int = Field(..., ge=0, description="전체 행 수")
     non_empty_count: int = Field(..., ge=0, description="값이 있는 행 수")
@@ -61,9 +64,22 @@ class ColumnStats(BaseModel):
     unique_count: int = Field(..., ge=0, description="고유 값 수")
     sample_values: list[str] = Field(default_factory=list, max_length=5, description="샘플 값 (최대 5개)")
 
+    def to_plain_dict(self) -> dict:
+        """model_dump()와 같은 결과를 스키마 순회 없이 반환"""
+        return {
+            "column_name": self.column_name,
+            "total_rows": self.total_rows,
+            "non_empty_count": self.non_empty_count,
+            "empty_count": self.empty_count,
+            "unique_count": self.unique_count,
+            "sample_values": list(self.sample_values),
+        }
+
 
 class ColumnKeep(BaseModel):
     """유지할 컬럼 정보"""
+    model_config = ConfigDict(frozen=True)
+
     column_name: str = Field(..., description="원본 컬럼 이름")
     target_object: ObjectType = Field(..., description="매핑할 오브젝트 타입")
     suggested_field_label: str = Field(..., description="제안 필드 라벨 (예: '고객 - 이름')")
@@ -82,6 +98,8 @@ class ColumnKeep(BaseModel):
 
 class ColumnSkip(BaseModel):
     """제외할 컬럼 정보"""
+    model_config = ConfigDict(frozen=True)
+
     column_name: str = Field(..., description="컬럼 이름")
     reason: SkipReason = Field(..., description="제외 사유")
     detail: Optional[str] = Field(None, description="상세 설명")
@@ -98,9 +116,9 @@ class TriageResult(BaseModel):
     @classmethod
     def validate_no_duplicates(cls, v: list) -> list:
         """중복 컬럼 검증"""
-        names = [item.column_name for item in v]
-        if len(names) != len(set(names)):
-            duplicates = [n for n in names if names.count(n) > 1]
+        counts = Counter(item.column_name for item in v)
+        duplicates = [n for n, c in counts.items() if c > 1]
+        if duplicates:
             raise ValueError(f"중복된 컬럼이 있습니다: {set(duplicates)}")
         return v
 
@@ -111,6 +129,8 @@ class TriageResult(BaseModel):
 
 class FieldMapping(BaseModel):
     """개별 필드 매핑"""
+    model_config = ConfigDict(frozen=True)
+
     source_column: str = Field(..., description="원본 컬럼 이름")
     target_object: ObjectType = Field(..., description="대상 오브젝트")
     target_field_id: Optional[str] = Field(None, description="기존 필드 ID (새 필드면 None)")
@@ -151,6 +171,8 @@ class ValidationSeverity(str, Enum):
 
 class ValidationErrorItem(BaseModel):
     """개별 검증 오류"""
+    model_config = ConfigDict(frozen=True)
+
     field: str = Field(..., description="오류 발생 필드")
     message: str = Field(..., description="오류 메시지")
     severity: ValidationSeverity = Field(default=ValidationSeverity.ERROR, description="심각도")
@@ -159,6 +181,8 @@ class ValidationErrorItem(BaseModel):
 
 class AutoFixItem(BaseModel):
     """자동 수정 항목"""
+    model_config = ConfigDict(frozen=True)
+
     field: str = Field(..., description="수정 필드")
     original_value: str = Field(..., description="원래 값")
     fixed_value: str = Field(..., description="수정된 값")
@@ -180,6 +204,8 @@ class ValidationResult(BaseModel):
 
 class RepairRequest(BaseModel):
     """수정 요청"""
+    model_config = ConfigDict(defer_build=True)
+
     original_response: dict = Field(..., description="원본 LLM 응답")
     validation_errors: list[ValidationErrorItem] = Field(..., description="검증 오류 목록")
     repair_instruction: str = Field(..., description="수정 지시사항")
@@ -198,6 +224,8 @@ class ExportFormat(str, Enum):
 
 class ExportRequest(BaseModel):
     """내보내기 요청"""
+    model_config = ConfigDict(defer_build=True)
+
     data: list[dict] = Field(..., min_length=1, description="내보낼 데이터")
     mappings: list[FieldMapping] = Field(..., description="필드 매핑")
     object_types: list[ObjectType] = Field(..., min_length=1, description="오브젝트 타입")
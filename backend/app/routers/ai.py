@@ -2,15 +2,19 @@
 AI Router
 Triage, Mapping API 엔드포인트
 """
+import asyncio
 import os
+from functools import lru_cache
 from typing import Optional
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
+import orjson
 
 from app.models.schemas import (
     TriageRequest, TriageResponse, TriageResult,
     MappingRequest, MappingResponse, MappingResult,
-    ColumnKeep, ObjectType, ValidationResult,
+    ColumnKeep, ColumnStats, ValidationResult,
 )
 from app.services.llm import OpenAIProvider, LLMConfig
 from app.services.llm.prompts import build_triage_prompt, build_mapping_prompt
@@ -21,14 +25,11 @@ from app.services.validator import triage_validator, mapping_validator
 router = APIRouter(prefix="/ai", tags=["ai"])
 
 
-def get_llm_provider() -> OpenAIProvider:
-    """LLM Provider 생성"""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise HTTPException(status_code=500, detail="OPENAI_API_KEY not configured")
-
+@lru_cache(maxsize=1)
+def _build_llm_provider(api_key: str, model: str) -> OpenAIProvider:
+    """LLM Provider 생성 (API 키/모델이 같으면 클라이언트 재사용)"""
     config = LLMConfig(
-        model=os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+        model=model,
         temperature=0.3,
         max_tokens=4000,
         json_mode=True,
@@ -36,8 +37,17 @@ def get_llm_provider() -> OpenAIProvider:
     return OpenAIProvider(api_key=api_key, config=config)
 
 
+def get_llm_provider() -> OpenAIProvider:
+    """LLM Provider 반환"""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise HTTPException(status_code=500, detail="OPENAI_API_KEY not configured")
+
+    return _build_llm_provider(api_key, os.getenv("OPENAI_MODEL", "gpt-4o-mini"))
+
+
 @router.post("/triage", response_model=TriageResponse)
-async def triage_columns(request: TriageRequest) -> TriageResponse:
+async def triage_columns(request: TriageRequest) -> TriageResponse | ORJSONResponse:
     """
     컬럼 분류 (Triage)
 
@@ -51,14 +61,15 @@ async def triage_columns(request: TriageRequest) -> TriageResponse:
         # 컬럼 통계 계산 (제공되지 않은 경우)
         column_stats = request.column_stats
         if not column_stats:
-            analysis = file_analyzer.analyze(request.sample_data)
+            # CPU 작업은 스레드에서 실행해 이벤트 루프를 막지 않음
+            analysis = await asyncio.to_thread(file_analyzer.analyze, request.sample_data)
             column_stats = analysis.column_stats
 
         # 프롬프트 생성
         system_prompt, user_prompt = build_triage_prompt(
             columns=request.columns,
             sample_data=request.sample_data,
-            column_stats=[s.model_dump() for s in column_stats] if column_stats else None,
+            column_stats=[s.to_plain_dict() for s in column_stats] if column_stats else None,
             business_context=request.business_context,
         )
 
@@ -71,12 +82,14 @@ async def triage_columns(request: TriageRequest) -> TriageResponse:
         )
 
         if result.success and result.result:
-            return TriageResponse(
+            # 이미 검증된 결과이므로 재검증 없이 바로 직렬화
+            response = TriageResponse.model_construct(
                 success=True,
                 result=result.result,
                 validation=result.validation,
                 repair_attempts=result.attempts,
             )
+            return ORJSONResponse(content=response.model_dump(mode="json"))
         else:
             return TriageResponse(
                 success=False,
@@ -95,7 +108,7 @@ async def triage_columns(request: TriageRequest) -> TriageResponse:
 
 
 @router.post("/map", response_model=MappingResponse)
-async def map_fields(request: MappingRequest) -> MappingResponse:
+async def map_fields(request: MappingRequest) -> MappingResponse | ORJSONResponse:
     """
     필드 매핑 (Mapping)
 
@@ -107,11 +120,12 @@ async def map_fields(request: MappingRequest) -> MappingResponse:
 
         # ColumnKeep 객체를 dict로 변환
         columns_to_keep_dicts = [c.model_dump() for c in request.columns_to_keep]
+        object_type_strs = [ot.value for ot in request.object_types]
 
         # 프롬프트 생성
         system_prompt, user_prompt = build_mapping_prompt(
             columns_to_keep=columns_to_keep_dicts,
-            object_types=[ot.value if isinstance(ot, ObjectType) else ot for ot in request.object_types],
+            object_types=object_type_strs,
             available_fields=request.available_fields,
             sample_data=request.sample_data,
         )
@@ -122,17 +136,19 @@ async def map_fields(request: MappingRequest) -> MappingResponse:
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             columns_to_keep=request.columns_to_keep,
-            object_types=[ot.value if isinstance(ot, ObjectType) else ot for ot in request.object_types],
+            object_types=object_type_strs,
             available_fields=request.available_fields,
         )
 
         if result.success and result.result:
-            return MappingResponse(
+            # 이미 검증된 결과이므로 재검증 없이 바로 직렬화
+            response = MappingResponse.model_construct(
                 success=True,
                 result=result.result,
                 validation=result.validation,
                 repair_attempts=result.attempts,
             )
+            return ORJSONResponse(content=response.model_dump(mode="json"))
         else:
             return MappingResponse(
                 success=False,
@@ -245,7 +261,7 @@ class AnalyzeResponse(BaseModel):
     success: bool
     columns: list[str]
     total_rows: int
-    column_stats: list[dict]
+    column_stats: list[ColumnStats]
     sample_data: list[dict]
     skip_candidates: list[dict]
     error: Optional[str] = None
@@ -261,7 +277,9 @@ async def analyze_file(request: AnalyzeRequest) -> AnalyzeResponse:
     - 제외 후보 컬럼 식별
     """
     try:
-        analysis = file_analyzer.analyze(request.data, request.sample_count)
+        analysis = await asyncio.to_thread(
+            file_analyzer.analyze, request.data, request.sample_count
+        )
 
         # 제외 후보 식별
         skip_candidates = []
@@ -277,7 +295,7 @@ async def analyze_file(request: AnalyzeRequest) -> AnalyzeResponse:
             success=True,
             columns=analysis.columns,
             total_rows=analysis.total_rows,
-            column_stats=[s.model_dump() for s in analysis.column_stats],
+            column_stats=analysis.column_stats,
             sample_data=analysis.sample_data,
             skip_candidates=skip_candidates,
         )
@@ -292,3 +310,39 @@ async def analyze_file(request: AnalyzeRequest) -> AnalyzeResponse:
             skip_candidates=[],
             error=str(e),
         )
+
+
+@router.post("/analyze/stream")
+async def analyze_file_stream(request: AnalyzeRequest) -> StreamingResponse:
+    """
+    파일 분석 (NDJSON 스트리밍)
+
+    - 첫 줄: 컬럼 목록과 전체 행 수 (type=meta)
+    - 컬럼마다 한 줄: 컬럼 통계와 제외 사유 (type=column)
+    - 마지막 줄: 샘플 데이터 (type=sample), 실패 시 type=error
+    """
+    def generate():
+        try:
+            columns = list(request.data[0].keys()) if request.data else []
+            yield orjson.dumps({
+                "type": "meta",
+                "columns": columns,
+                "total_rows": len(request.data),
+            }) + b"\n"
+
+            for stats in file_analyzer.iter_column_stats(request.data):
+                is_skip, reason = file_analyzer.is_skip_candidate(stats)
+                yield orjson.dumps({
+                    "type": "column",
+                    "stats": stats.to_plain_dict(),
+                    "skip_reason": reason if is_skip else None,
+                }) + b"\n"
+
+            yield orjson.dumps({
+                "type": "sample",
+                "sample_data": request.data[:request.sample_count],
+            }) + b"\n"
+        except Exception as e:
+            yield orjson.dumps({"type": "error", "error": str(e)}) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
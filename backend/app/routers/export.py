@@ -2,24 +2,65 @@
 Export Router
 데이터 내보내기 API 엔드포인트
 """
+import asyncio
 import os
+import re
 from typing import Optional
+import anyio
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
+from starlette.types import Receive, Scope, Send
 from pydantic import BaseModel
 
 from app.models.schemas import (
-    FieldMapping, ExportFormat, ExportRequest, ExportResponse, ObjectType
+    FieldMapping, ExportFormat, ExportRequest, ExportResponse
 )
 from app.services.exporter import exporter
 
 router = APIRouter(prefix="/export", tags=["export"])
 
+# 다운로드 허용 파일명 (exporter가 생성하는 ASCII 파일명)
+_is_safe_filename = re.compile(r'\A[A-Za-z0-9._-]+\Z').match
+
+
+class ZeroCopyFileResponse(FileResponse):
+    """
+    파일 응답 (zero-copy 전송 지원)
+
+    ASGI 서버가 http.response.zerocopysend 확장을 지원하면 파일 디스크립터를
+    서버에 넘겨 sendfile(2)로 전송하고, 아니면 기존 FileResponse 방식으로 전송한다.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            "http.response.zerocopysend" not in scope.get("extensions", {})
+            or scope["method"].upper() == "HEAD"
+        ):
+            await super().__call__(scope, receive, send)
+            return
+
+        if self.stat_result is None:
+            stat_result = await anyio.to_thread.run_sync(os.stat, self.path)
+            self.set_stat_headers(stat_result)
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        with open(self.path, "rb") as file:
+            await send({
+                "type": "http.response.zerocopysend",
+                "file": file,
+                "more_body": False,
+            })
+        if self.background is not None:
+            await self.background()
+
 
 class ExportRequestBody(BaseModel):
     """내보내기 요청 바디"""
     data: list[dict]
-    mappings: list[dict]  # FieldMapping dict
+    mappings: list[FieldMapping]
     object_types: list[str]
     format: str = "xlsx"
     include_summary: bool = True
@@ -35,38 +76,16 @@ async def export_data(request: ExportRequestBody) -> ExportResponse:
     - 요약 시트 포함 옵션
     """
     try:
-        # FieldMapping 객체로 변환
-        mappings = []
-        for m in request.mappings:
-            # target_object를 ObjectType으로 변환
-            target_obj = m.get('target_object')
-            if isinstance(target_obj, str):
-                try:
-                    target_obj = ObjectType(target_obj)
-                except ValueError:
-                    pass
-
-            mappings.append(FieldMapping(
-                source_column=m.get('source_column', ''),
-                target_object=target_obj,
-                target_field_id=m.get('target_field_id'),
-                target_field_label=m.get('target_field_label', ''),
-                field_type=m.get('field_type', 'text'),
-                is_new_field=m.get('is_new_field', False),
-                is_required=m.get('is_required', False),
-                is_unique=m.get('is_unique', False),
-                confidence=m.get('confidence', 1.0),
-            ))
-
         # 형식 변환
         export_format = ExportFormat.EXCEL
         if request.format.lower() in ['csv', 'text/csv']:
             export_format = ExportFormat.CSV
 
-        # 내보내기 실행
-        result = exporter.export(
+        # 내보내기 실행 (파일 생성은 스레드에서 실행해 이벤트 루프를 막지 않음)
+        result = await asyncio.to_thread(
+            exporter.export,
             data=request.data,
-            mappings=mappings,
+            mappings=request.mappings,
             object_types=request.object_types,
             format=export_format,
             include_summary=request.include_summary,
@@ -104,8 +123,8 @@ async def download_file(filename: str):
 
     - 내보낸 파일 다운로드
     """
-    # 보안: 파일명에 경로 조작 문자가 없는지 확인
-    if '..' in filename or '/' in filename or '\\' in filename:
+    # 보안: 허용 문자만으로 된 파일명인지 확인 (경로 구분자/제어 문자 차단)
+    if not _is_safe_filename(filename) or '..' in filename:
         raise HTTPException(status_code=400, detail="Invalid filename")
 
     file_path = os.path.join(exporter.exports_dir, filename)
@@ -121,13 +140,19 @@ async def download_file(filename: str):
     else:
         media_type = "application/octet-stream"
 
-    return FileResponse(
+    return ZeroCopyFileResponse(
         path=file_path,
         filename=filename,
         media_type=media_type,
     )
 
 
+# /list 응답 캐시 (exports 디렉토리 mtime 기준)
+# 디렉토리 mtime은 파일 추가/삭제에만 바뀌므로, 작성 중이던 파일이 목록에 잡히면
+# 다음 파일 추가/삭제 전까지 크기가 실제보다 작게 보일 수 있다 (목록 표시용이라 허용)
+_list_cache: dict = {"mtime": None, "payload": None}
+
+
 @router.get("/list")
 async def list_exports():
     """
@@ -136,22 +161,30 @@ async def list_exports():
     - 생성된 내보내기 파일 목록 조회
     """
     try:
+        # 디렉토리 mtime이 그대로면 (파일 추가/삭제 없음) 캐시된 목록 반환
+        dir_mtime = os.stat(exporter.exports_dir).st_mtime_ns
+        if _list_cache["mtime"] == dir_mtime:
+            return _list_cache["payload"]
+
         files = []
-        for filename in os.listdir(exporter.exports_dir):
-            if filename.endswith(('.xlsx', '.csv')):
-                file_path = os.path.join(exporter.exports_dir, filename)
-                stat = os.stat(file_path)
-                files.append({
-                    "filename": filename,
-                    "size": stat.st_size,
-                    "created": stat.st_ctime,
-                    "download_url": f"/api/export/download/{filename}",
-                })
+        with os.scandir(exporter.exports_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(('.xlsx', '.csv')):
+                    stat = entry.stat()
+                    files.append({
+                        "filename": entry.name,
+                        "size": stat.st_size,
+                        "created": stat.st_ctime,
+                        "download_url": f"/api/export/download/{entry.name}",
+                    })
 
         # 최신순 정렬
         files.sort(key=lambda x: x['created'], reverse=True)
 
-        return {"success": True, "files": files}
+        payload = {"success": True, "files": files}
+        _list_cache["mtime"] = dir_mtime
+        _list_cache["payload"] = payload
+        return payload
 
     except Exception as e:
         return {"success": False, "files": [], "error": str(e)}
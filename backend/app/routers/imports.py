@@ -1,10 +1,17 @@
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import FileResponse, Response
+from starlette.background import BackgroundTask
+from pydantic import BaseModel, ValidationError as PydanticValidationError
 from typing import Optional, Literal
 from urllib.parse import quote
-import pandas as pd
+import asyncio
 import io
+import os
+import tempfile
+import numpy as np
+import orjson
+import pandas as pd
 
 router = APIRouter()
 
@@ -66,6 +73,36 @@ SALESMAP_FIELD_NAMES = {
     },
 }
 
+VALID_OBJECT_TYPES = frozenset(SALESMAP_OBJECT_NAMES)
+
+OBJECT_NAMES_KO = {"company": "회사", "people": "고객", "lead": "리드", "deal": "딜"}
+
+# Required target field per object type checked by /import/preview
+PREVIEW_REQUIRED_TARGETS = {
+    "people": "people.name",
+    "company": "company.name",
+    "lead": "lead.name",
+    "deal": "deal.name",
+}
+
+# Lead/Deal must map at least one of these connection target fields
+CONNECTION_TARGETS = {
+    "lead": frozenset(("lead.people_name", "lead.company_name")),
+    "deal": frozenset(("deal.people_name", "deal.company_name")),
+}
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Imports with at least this many rows are written to a temp file instead of memory
+IMPORT_TEMPFILE_THRESHOLD_ROWS = 5000
+
+# (objectType, fieldId) -> Salesmap import column name, e.g. "People - 이름"
+SALESMAP_COLUMN_NAMES = {
+    (obj_type, field_id): f"{SALESMAP_OBJECT_NAMES[obj_type]} - {label}"
+    for obj_type, fields in SALESMAP_FIELD_NAMES.items()
+    for field_id, label in fields.items()
+}
+
 
 class FieldMapping(BaseModel):
     source_column: str
@@ -113,28 +150,139 @@ class ImportResponse(BaseModel):
     errors: list[str]
 
 
+def _parse_mappings(field_mappings: list[FieldMapping]) -> list[tuple[str, str, FieldMapping]]:
+    """
+    Split each mapping's target_field ("objectType.fieldId") once.
+    Mappings whose target_field is not in that format are dropped.
+    """
+    parsed = []
+    for mapping in field_mappings:
+        parts = mapping.target_field.split(".")
+        if len(parts) == 2:
+            parsed.append((parts[0], parts[1], mapping))
+    return parsed
+
+
+def _write_import_workbook(
+    target,
+    salesmap_columns: list[str],
+    source_columns: list[str],
+    data: list[dict],
+) -> None:
+    """
+    Transform data to Salesmap format and write rows directly to an xlsx
+    workbook (one pass over the data, no intermediate DataFrame).
+    `target` is a file path or a BytesIO.
+    """
+    # Imported lazily so workers that never serve /import don't load it
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(target, {
+        'constant_memory': True,
+        'in_memory': isinstance(target, io.BytesIO),
+        'strings_to_urls': False,
+    })
+    worksheet = workbook.add_worksheet('Import Data')
+    header_format = workbook.add_format({
+        'bold': True, 'border': 1, 'align': 'center', 'valign': 'top',
+    })
+    worksheet.write_row(0, 0, salesmap_columns, header_format)
+
+    # Columns that share a Salesmap header (two sources mapped to the same
+    # target) all take the value of the last such source present in the row
+    sources_by_column: dict[str, list[str]] = {}
+    for salesmap_column, source_column in zip(salesmap_columns, source_columns):
+        sources_by_column.setdefault(salesmap_column, []).append(source_column)
+    shared_sources = [
+        sources[::-1] if len(sources := sources_by_column[salesmap_column]) > 1 else None
+        for salesmap_column in salesmap_columns
+    ]
+    if not any(shared_sources):
+        shared_sources = None
+
+    source_set = frozenset(source_columns)
+    row_count = 0
+    for row in data:
+        # Only add non-empty rows (rows with at least one mapped column)
+        if source_set.isdisjoint(row):
+            continue
+        row_count += 1
+        if shared_sources is None:
+            # Handle None values (dict lookups run in C via map)
+            values = map(row.get, source_columns)
+        else:
+            values = [
+                row.get(source_column) if candidates is None
+                else next((row[c] for c in candidates if c in row), None)
+                for source_column, candidates in zip(source_columns, shared_sources)
+            ]
+        worksheet.write_row(row_count, 0, ["" if value is None else value for value in values])
+
+    workbook.close()
+
+    # Validate that we have data to export
+    if not row_count:
+        raise HTTPException(
+            status_code=400,
+            detail="변환할 데이터가 없습니다. 데이터와 매핑을 확인해주세요."
+        )
+
+
+async def parse_import_request(raw: Request) -> ImportRequest:
+    """
+    Parse an ImportRequest body with orjson.
+    `data` (the large row payload) is attached after validating the other
+    fields, so its rows are not walked and copied by Pydantic when every
+    row is already a JSON object.
+    """
+    try:
+        body = orjson.loads(await raw.body())
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError([{
+            "type": "json_invalid",
+            "loc": ("body", e.pos),
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": e.msg},
+        }])
+
+    try:
+        data = body.get("data") if isinstance(body, dict) else None
+        if isinstance(data, list) and all(type(row) is dict for row in data):
+            request = ImportRequest.model_validate({**body, "data": []})
+            request.data = data
+            return request
+        return ImportRequest.model_validate(body)
+    except PydanticValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors()]
+        )
+
+
 @router.post("/import")
-async def import_data(request: ImportRequest):
+async def import_data(request: ImportRequest = Depends(parse_import_request)):
     """
     Generate an Excel file in Salesmap import format.
     Returns the file as a downloadable attachment.
     """
     try:
         # Validate object types
-        valid_types = {"company", "people", "lead", "deal"}
         for obj_type in request.object_types:
-            if obj_type not in valid_types:
+            if obj_type not in VALID_OBJECT_TYPES:
                 raise HTTPException(status_code=400, detail=f"잘못된 오브젝트 타입: {obj_type}")
 
-        # Group mappings by object type
-        mappings_by_object: dict[str, list[FieldMapping]] = {}
-        for mapping in request.field_mappings:
-            parts = mapping.target_field.split(".")
-            if len(parts) == 2:
-                obj_type, field_id = parts
-                if obj_type not in mappings_by_object:
-                    mappings_by_object[obj_type] = []
-                mappings_by_object[obj_type].append(mapping)
+        # Group mappings by object type (target_field is split once per mapping)
+        mappings_by_object: dict[str, list[tuple[str, str]]] = {}  # obj_type -> [(source_column, field_id)]
+        for obj_type, field_id, mapping in _parse_mappings(request.field_mappings):
+            mappings_by_object.setdefault(obj_type, []).append((mapping.source_column, field_id))
+
+        # Custom field column names (first definition wins)
+        custom_columns: dict[tuple[str, str], str] = {}
+        for custom_field in request.custom_fields:
+            custom_columns.setdefault(
+                (custom_field.objectType, custom_field.id),
+                f"{SALESMAP_OBJECT_NAMES.get(custom_field.objectType, custom_field.objectType)} - {custom_field.label}",
+            )
 
         # Build column headers and data in Salesmap format
         # Column format: "{ObjectType} - {FieldName}"
@@ -142,26 +290,17 @@ async def import_data(request: ImportRequest):
         column_mappings = []  # (source_column, salesmap_column)
 
         for obj_type in request.object_types:
-            obj_mappings = mappings_by_object.get(obj_type, [])
             salesmap_obj_name = SALESMAP_OBJECT_NAMES.get(obj_type, obj_type)
 
-            for mapping in obj_mappings:
-                field_id = mapping.target_field.split(".")[1]
-
-                # Check if it's a custom field
-                custom_field = next(
-                    (f for f in request.custom_fields if f.objectType == obj_type and f.id == field_id),
-                    None
+            for source_column, field_id in mappings_by_object.get(obj_type, []):
+                key = (obj_type, field_id)
+                salesmap_column = (
+                    custom_columns.get(key)
+                    or SALESMAP_COLUMN_NAMES.get(key)
+                    or f"{salesmap_obj_name} - {field_id}"
                 )
-
-                if custom_field:
-                    field_label = custom_field.label
-                else:
-                    field_label = SALESMAP_FIELD_NAMES.get(obj_type, {}).get(field_id, field_id)
-
-                salesmap_column = f"{salesmap_obj_name} - {field_label}"
                 salesmap_columns.append(salesmap_column)
-                column_mappings.append((mapping.source_column, salesmap_column))
+                column_mappings.append((source_column, salesmap_column))
 
         # Validate that we have columns to export
         if not salesmap_columns:
@@ -170,52 +309,43 @@ async def import_data(request: ImportRequest):
                 detail="매핑된 필드가 없습니다. 최소 하나의 필드를 매핑해주세요."
             )
 
-        # Transform data to Salesmap format
-        transformed_data = []
-        for row in request.data:
-            new_row = {}
-            for source_col, salesmap_col in column_mappings:
-                if source_col in row:
-                    value = row[source_col]
-                    # Handle None values
-                    new_row[salesmap_col] = value if value is not None else ""
-            if new_row:  # Only add non-empty rows
-                transformed_data.append(new_row)
-
-        # Validate that we have data to export
-        if not transformed_data:
-            raise HTTPException(
-                status_code=400,
-                detail="변환할 데이터가 없습니다. 데이터와 매핑을 확인해주세요."
-            )
-
-        # Create DataFrame with Salesmap column order
-        df = pd.DataFrame(transformed_data)
-
-        # Ensure all columns exist and are in correct order
-        for col in salesmap_columns:
-            if col not in df.columns:
-                df[col] = ""
-        df = df[salesmap_columns]
-
-        # Generate Excel file
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='Import Data')
-        output.seek(0)
+        source_columns = [source_col for source_col, _ in column_mappings]
 
         # Return as downloadable file
         # Use URL encoding for non-ASCII filenames (RFC 5987)
         base_filename = request.filename.rsplit('.', 1)[0]
         filename = f"salesmap_import_{base_filename}.xlsx"
-        encoded_filename = quote(filename)
+        headers = {
+            "Content-Disposition": f"attachment; filename*=UTF-8''{quote(filename)}"
+        }
+
+        # Small imports are built in memory; large ones go to a temp file
+        # so the response streams from disk
+        if len(request.data) < IMPORT_TEMPFILE_THRESHOLD_ROWS:
+            output = io.BytesIO()
+            _write_import_workbook(output, salesmap_columns, source_columns, request.data)
+            return Response(
+                content=output.getvalue(),
+                media_type=XLSX_MEDIA_TYPE,
+                headers=headers,
+            )
 
-        return StreamingResponse(
-            output,
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={
-                "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}"
-            }
+        tmp = tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx')
+        tmp.close()
+        try:
+            # Large workbooks are built in a worker thread so the event loop stays free
+            await asyncio.to_thread(
+                _write_import_workbook, tmp.name, salesmap_columns, source_columns, request.data
+            )
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+
+        return FileResponse(
+            tmp.name,
+            media_type=XLSX_MEDIA_TYPE,
+            headers=headers,
+            background=BackgroundTask(os.unlink, tmp.name),
         )
     except HTTPException:
         raise
@@ -224,58 +354,33 @@ async def import_data(request: ImportRequest):
 
 
 @router.post("/import/preview", response_model=ImportResponse)
-async def preview_import(request: ImportRequest):
+async def preview_import(request: ImportRequest = Depends(parse_import_request)):
     """
     Preview the import without generating a file.
     Returns count and validation info.
     """
-    valid_types = {"company", "people", "lead", "deal"}
     errors = []
 
     for obj_type in request.object_types:
-        if obj_type not in valid_types:
+        if obj_type not in VALID_OBJECT_TYPES:
             errors.append(f"잘못된 오브젝트 타입: {obj_type}")
 
-    # Count mappings per object
-    mappings_by_object: dict[str, int] = {}
-    for mapping in request.field_mappings:
-        parts = mapping.target_field.split(".")
-        if len(parts) == 2:
-            obj_type = parts[0]
-            mappings_by_object[obj_type] = mappings_by_object.get(obj_type, 0) + 1
+    # Mapped target fields, built once for O(1) membership checks
+    present = frozenset(m.target_field for m in request.field_mappings)
 
     # Validate required fields
-    required_fields = {
-        "people": "name",
-        "company": "name",
-        "lead": "name",
-        "deal": "name",
-    }
-
     for obj_type in request.object_types:
-        required = required_fields.get(obj_type)
+        required = PREVIEW_REQUIRED_TARGETS.get(obj_type)
         if required:
-            has_required = any(
-                m.target_field == f"{obj_type}.{required}"
-                for m in request.field_mappings
-            )
-            if not has_required:
-                obj_name = {"company": "회사", "people": "고객", "lead": "리드", "deal": "딜"}.get(obj_type, obj_type)
+            if required not in present:
+                obj_name = OBJECT_NAMES_KO.get(obj_type, obj_type)
                 errors.append(f"{obj_name}의 필수 필드 '이름'이 매핑되지 않았습니다")
 
     # Validate lead/deal connection requirement
-    for obj_type in ["lead", "deal"]:
+    for obj_type, connection_targets in CONNECTION_TARGETS.items():
         if obj_type in request.object_types:
-            has_people_name = any(
-                m.target_field == f"{obj_type}.people_name"
-                for m in request.field_mappings
-            )
-            has_company_name = any(
-                m.target_field == f"{obj_type}.company_name"
-                for m in request.field_mappings
-            )
-            if not has_people_name and not has_company_name:
-                obj_name = {"lead": "리드", "deal": "딜"}.get(obj_type, obj_type)
+            if connection_targets.isdisjoint(present):
+                obj_name = OBJECT_NAMES_KO.get(obj_type, obj_type)
                 errors.append(f"{obj_name}은 '연결된 고객 이름' 또는 '연결된 회사 이름' 중 하나가 반드시 매핑되어야 합니다")
 
     return ImportResponse(
@@ -288,217 +393,226 @@ async def preview_import(request: ImportRequest):
 import re
 from datetime import datetime
 
+# Date/datetime separators are '-', '/' or '.', used consistently within a value
+_DATE_RE = re.compile(r'^\d{4}([-/.])\d{2}\1\d{2}$')
+_DATETIME_RE = re.compile(r'^\d{4}([-/.])\d{2}\1\d{2} \d{2}:\d{2}$')
+_EMAIL_RE = re.compile(r'^[^@]+@[^@]+\.[^@]+$')
+
+
 def validate_date(value: str) -> bool:
     """Validate date format YYYY-MM-DD"""
     if not value:
         return True
-    patterns = [
-        r'^\d{4}-\d{2}-\d{2}$',
-        r'^\d{4}/\d{2}/\d{2}$',
-        r'^\d{4}\.\d{2}\.\d{2}$',
-    ]
-    return any(re.match(p, str(value)) for p in patterns)
+    return _DATE_RE.match(str(value)) is not None
 
 
 def validate_datetime(value: str) -> bool:
     """Validate datetime format YYYY-MM-DD HH:mm"""
     if not value:
         return True
-    patterns = [
-        r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$',
-        r'^\d{4}/\d{2}/\d{2} \d{2}:\d{2}$',
-        r'^\d{4}\.\d{2}\.\d{2} \d{2}:\d{2}$',
-    ]
-    return any(re.match(p, str(value)) for p in patterns)
+    return _DATETIME_RE.match(str(value)) is not None
 
 
 def validate_email(value: str) -> bool:
     """Validate email format"""
     if not value:
         return True
-    return bool(re.match(r'^[^@]+@[^@]+\.[^@]+$', str(value)))
+    return _EMAIL_RE.match(str(value)) is not None
 
 
-def validate_number(value) -> bool:
-    """Validate number format"""
-    if value is None or value == '':
-        return True
+def _is_number_str(value: str) -> bool:
+    """Number check for an already-stringified, non-empty value"""
     try:
-        float(str(value).replace(',', ''))
+        float(value.replace(',', ''))
         return True
     except:
         return False
 
 
+def validate_number(value) -> bool:
+    """Validate number format"""
+    if value is None or value == '':
+        return True
+    return _is_number_str(str(value))
+
+
+_BOOLEAN_VALUES = frozenset(('TRUE', 'FALSE', '1', '0', 'YES', 'NO'))
+
+
 def validate_boolean(value: str) -> bool:
     """Validate boolean format"""
     if not value:
         return True
-    return str(value).upper() in ['TRUE', 'FALSE', '1', '0', 'YES', 'NO']
+    return str(value).upper() in _BOOLEAN_VALUES
+
+
+def _matches_per_distinct(str_values, check) -> np.ndarray:
+    """
+    Run `check` once per distinct value of a column and broadcast the
+    result back to every row (import files repeat the same dates, emails
+    and owners many times).
+    """
+    codes, uniques = pd.factorize(str_values)
+    results = np.fromiter((bool(check(v)) for v in uniques), dtype=bool, count=len(uniques))
+    return results[codes]
 
 
 @router.post("/import/validate", response_model=ValidationResult)
-async def validate_import(request: ImportRequest):
+async def validate_import(request: ImportRequest = Depends(parse_import_request)):
     """
     Validate import data row by row.
     Returns detailed validation results with errors and warnings.
     """
-    validation_errors: list[ValidationError] = []
-    valid_row_indices: list[int] = []
+    if not request.data:
+        return ValidationResult.model_construct(
+            success=True,
+            total_rows=0,
+            valid_rows=0,
+            error_count=0,
+            warning_count=0,
+            errors=[],
+            valid_row_indices=[]
+        )
 
     # Build mapping lookup: source_column -> (object_type, field_id, field_info)
     field_lookup: dict[str, tuple] = {}
-    for mapping in request.field_mappings:
-        parts = mapping.target_field.split(".")
-        if len(parts) == 2:
-            obj_type, field_id = parts
-            # Find field info from OBJECT_FIELDS
-            field_info = None
-            if obj_type in OBJECT_FIELDS:
-                for f in OBJECT_FIELDS[obj_type]["fields"]:
-                    if f["id"] == field_id:
-                        field_info = f
-                        break
-            # Check custom fields
-            if not field_info:
-                for cf in request.custom_fields:
-                    if cf.objectType == obj_type and cf.id == field_id:
-                        field_info = {"id": cf.id, "label": cf.label, "type": cf.type, "required": False}
-                        break
-            field_lookup[mapping.source_column] = (obj_type, field_id, field_info)
-
-    # Track unique values for duplicate detection
-    unique_values: dict[str, set] = {}
-
-    # Validate each row
-    for row_idx, row in enumerate(request.data, start=1):
-        row_has_error = False
-
-        # Check each mapped field
-        for source_col, (obj_type, field_id, field_info) in field_lookup.items():
-            value = row.get(source_col)
-            field_label = field_info["label"] if field_info else field_id
-
-            if not field_info:
-                continue
-
-            field_type = field_info.get("type", "text")
-            is_required = field_info.get("required", False)
-            is_unique = field_info.get("unique", False)
-
-            # Required field validation
-            if is_required and (value is None or str(value).strip() == ''):
-                validation_errors.append(ValidationError(
-                    row=row_idx,
-                    field=field_label,
-                    message=f"'{field_label}' 필드는 필수입니다",
-                    severity="error"
-                ))
-                row_has_error = True
-                continue
-
-            # Skip further validation if value is empty
-            if value is None or str(value).strip() == '':
-                continue
-
-            str_value = str(value).strip()
-
-            # Type-specific validation
-            if field_type == "date" and not validate_date(str_value):
-                validation_errors.append(ValidationError(
-                    row=row_idx,
-                    field=field_label,
-                    message=f"날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)",
-                    severity="error"
-                ))
-                row_has_error = True
-
-            elif field_type == "datetime" and not validate_datetime(str_value):
-                validation_errors.append(ValidationError(
-                    row=row_idx,
-                    field=field_label,
-                    message=f"날짜/시간 형식이 올바르지 않습니다 (YYYY-MM-DD HH:mm)",
-                    severity="error"
-                ))
-                row_has_error = True
-
-            elif field_type == "email" and not validate_email(str_value):
-                validation_errors.append(ValidationError(
-                    row=row_idx,
-                    field=field_label,
-                    message=f"이메일 형식이 올바르지 않습니다",
-                    severity="error"
-                ))
-                row_has_error = True
-
-            elif field_type == "number" and not validate_number(str_value):
-                validation_errors.append(ValidationError(
-                    row=row_idx,
-                    field=field_label,
-                    message=f"숫자 형식이 올바르지 않습니다",
-                    severity="error"
-                ))
-                row_has_error = True
-
-            elif field_type == "boolean" and not validate_boolean(str_value):
-                validation_errors.append(ValidationError(
-                    row=row_idx,
-                    field=field_label,
-                    message=f"TRUE 또는 FALSE만 입력 가능합니다",
-                    severity="error"
-                ))
-                row_has_error = True
-
-            # Unique value validation
-            if is_unique and str_value:
-                unique_key = f"{obj_type}.{field_id}"
-                if unique_key not in unique_values:
-                    unique_values[unique_key] = set()
-
-                if str_value.lower() in unique_values[unique_key]:
-                    validation_errors.append(ValidationError(
-                        row=row_idx,
-                        field=field_label,
-                        message=f"중복된 값입니다: {str_value}",
-                        severity="warning"
-                    ))
-                else:
-                    unique_values[unique_key].add(str_value.lower())
-
-        # Check Lead/Deal connection requirement - must have people_name or company_name in the same row
-        for obj_type in ["lead", "deal"]:
-            if obj_type in request.object_types:
-                # Find source columns mapped to people_name or company_name for this object
-                people_name_col = None
-                company_name_col = None
-                for source_col, (o_type, field_id, _) in field_lookup.items():
-                    if o_type == obj_type:
-                        if field_id == "people_name":
-                            people_name_col = source_col
-                        elif field_id == "company_name":
-                            company_name_col = source_col
-
-                # Check if at least one connection field has a value in this row
-                people_value = row.get(people_name_col, "") if people_name_col else ""
-                company_value = row.get(company_name_col, "") if company_name_col else ""
-
-                if not str(people_value).strip() and not str(company_value).strip():
-                    obj_name = {"lead": "리드", "deal": "딜"}.get(obj_type, obj_type)
-                    validation_errors.append(ValidationError(
-                        row=row_idx,
-                        field="연결",
-                        message=f"{obj_name}은 '연결된 고객 이름' 또는 '연결된 회사 이름' 중 하나가 반드시 입력되어야 합니다",
-                        severity="error"
-                    ))
-                    row_has_error = True
-
-        if not row_has_error:
-            valid_row_indices.append(row_idx - 1)  # Store 0-indexed
-
-    error_count = len([e for e in validation_errors if e.severity == "error"])
-    warning_count = len([e for e in validation_errors if e.severity == "warning"])
-
-    return ValidationResult(
+    custom_by_key: dict[tuple[str, str], CustomField] = {}
+    for cf in request.custom_fields:
+        custom_by_key.setdefault((cf.objectType, cf.id), cf)
+    for obj_type, field_id, mapping in _parse_mappings(request.field_mappings):
+        # Find field info from OBJECT_FIELDS
+        field_info = OBJECT_FIELD_INDEX.get(obj_type, {}).get(field_id)
+        # Check custom fields
+        if not field_info:
+            cf = custom_by_key.get((obj_type, field_id))
+            if cf:
+                field_info = {"id": cf.id, "label": cf.label, "type": cf.type, "required": False}
+        field_lookup[mapping.source_column] = (obj_type, field_id, field_info)
+
+    # Source columns mapped to Lead/Deal people_name or company_name
+    connection_columns: dict[str, dict[str, str]] = {}
+    for source_col, (obj_type, field_id, _) in field_lookup.items():
+        if field_id in ("people_name", "company_name"):
+            connection_columns.setdefault(obj_type, {})[field_id] = source_col
+
+    # Validate column by column with pandas string ops, then emit errors in
+    # row order. Each entry: (row_idx, field_order, sub_order, ValidationError)
+    data = request.data
+    found: list[tuple[int, int, int, ValidationError]] = []
+    error_rows = np.zeros(len(data), dtype=bool)
+    counts = {"error": 0, "warning": 0}
+
+    def add_errors(mask, order: int, sub: int, field: str, message: str, severity: str = "error"):
+        rows = np.flatnonzero(mask)
+        counts[severity] += len(rows)
+        if severity == "error":
+            error_rows[rows] = True
+        for i in rows:
+            found.append((i, order, sub, ValidationError.model_construct(
+                row=int(i) + 1,
+                field=field,
+                message=message,
+                severity=severity
+            )))
+
+    # Unique checks share one value set per (obj_type, field_id)
+    unique_groups: dict[tuple[str, str], list[tuple[int, str, pd.Series, np.ndarray]]] = {}
+
+    for order, (source_col, (obj_type, field_id, field_info)) in enumerate(field_lookup.items()):
+        if not field_info:
+            continue
+
+        field_label = field_info["label"]
+        field_type = field_info.get("type", "text")
+        is_required = field_info.get("required", False)
+        is_unique = field_info.get("unique", False)
+
+        raw_values = [row.get(source_col) for row in data]
+        str_values = pd.Series(raw_values, dtype=object).astype(str).str.strip()
+        empty = np.fromiter((v is None for v in raw_values), dtype=bool, count=len(raw_values))
+        empty |= (str_values == '').to_numpy()
+        non_empty = ~empty
+
+        # Required field validation
+        if is_required:
+            add_errors(empty, order, 0, field_label, f"'{field_label}' 필드는 필수입니다")
+
+        # Type-specific validation (non-empty values only)
+        if field_type == "date":
+            invalid = ~_matches_per_distinct(str_values, _DATE_RE.match)
+            add_errors(non_empty & invalid, order, 0, field_label, "날짜 형식이 올바르지 않습니다 (YYYY-MM-DD)")
+        elif field_type == "datetime":
+            invalid = ~_matches_per_distinct(str_values, _DATETIME_RE.match)
+            add_errors(non_empty & invalid, order, 0, field_label, "날짜/시간 형식이 올바르지 않습니다 (YYYY-MM-DD HH:mm)")
+        elif field_type == "email":
+            invalid = ~_matches_per_distinct(str_values, _EMAIL_RE.match)
+            add_errors(non_empty & invalid, order, 0, field_label, "이메일 형식이 올바르지 않습니다")
+        elif field_type == "number":
+            invalid = ~_matches_per_distinct(str_values, _is_number_str)
+            add_errors(non_empty & invalid, order, 0, field_label, "숫자 형식이 올바르지 않습니다")
+        elif field_type == "boolean":
+            invalid = ~str_values.str.upper().isin(_BOOLEAN_VALUES).to_numpy(dtype=bool)
+            add_errors(non_empty & invalid, order, 0, field_label, "TRUE 또는 FALSE만 입력 가능합니다")
+        elif field_type == "select" and (options := OBJECT_FIELD_OPTIONS.get((obj_type, field_id))):
+            invalid = ~str_values.isin(options).to_numpy(dtype=bool)
+            add_errors(
+                non_empty & invalid, order, 0, field_label,
+                f"허용되지 않은 값입니다 ({', '.join(field_info['options'])} 중 하나)",
+                severity="warning"
+            )
+
+        if is_unique:
+            unique_groups.setdefault((obj_type, field_id), []).append(
+                (order, field_label, str_values, non_empty)
+            )
+
+    # Unique value validation: case-insensitive, first occurrence wins,
+    # scanning values in row-major order across columns sharing a target field
+    for columns in unique_groups.values():
+        frame = pd.DataFrame({
+            order: str_values.str.lower().where(non_empty)
+            for order, _, str_values, non_empty in columns
+        })
+        stacked = frame.stack(future_stack=True).dropna()
+        duplicated = stacked.duplicated().to_numpy()
+        counts["warning"] += int(duplicated.sum())
+        by_order = {
+            order: (field_label, str_values.to_numpy())
+            for order, field_label, str_values, _ in columns
+        }
+        for row_i, order in stacked.index[duplicated]:
+            field_label, values = by_order[order]
+            found.append((row_i, order, 1, ValidationError.model_construct(
+                row=int(row_i) + 1,
+                field=field_label,
+                message=f"중복된 값입니다: {values[row_i]}",
+                severity="warning"
+            )))
+
+    # Check Lead/Deal connection requirement - must have people_name or company_name in the same row
+    for connection_order, obj_type in enumerate(["lead", "deal"], start=len(field_lookup)):
+        if obj_type in request.object_types:
+            # Check if at least one connection field has a value in each row
+            missing = np.ones(len(data), dtype=bool)
+            for col in connection_columns.get(obj_type, {}).values():
+                if col:
+                    values = pd.Series([row.get(col, "") for row in data], dtype=object)
+                    missing &= (values.astype(str).str.strip() == '').to_numpy()
+
+            obj_name = {"lead": "리드", "deal": "딜"}.get(obj_type, obj_type)
+            add_errors(
+                missing, connection_order, 0, "연결",
+                f"{obj_name}은 '연결된 고객 이름' 또는 '연결된 회사 이름' 중 하나가 반드시 입력되어야 합니다"
+            )
+
+    found.sort(key=lambda entry: entry[:3])
+    validation_errors = [entry[3] for entry in found]
+    valid_row_indices = np.flatnonzero(~error_rows).tolist()  # 0-indexed
+
+    error_count = counts["error"]
+    warning_count = counts["warning"]
+
+    return ValidationResult.model_construct(
         success=error_count == 0,
         total_rows=len(request.data),
         valid_rows=len(valid_row_indices),
@@ -575,6 +689,21 @@ OBJECT_FIELDS = {
 }
 
 
+# obj_type -> field_id -> field info
+OBJECT_FIELD_INDEX = {
+    obj_type: {f["id"]: f for f in spec["fields"]}
+    for obj_type, spec in OBJECT_FIELDS.items()
+}
+
+# (obj_type, field_id) -> allowed values for select fields with fixed options
+OBJECT_FIELD_OPTIONS = {
+    (obj_type, f["id"]): frozenset(f["options"])
+    for obj_type, spec in OBJECT_FIELDS.items()
+    for f in spec["fields"]
+    if f.get("options")
+}
+
+
 # AI-powered endpoints
 from app.services.ai_service import auto_map_fields, detect_duplicates, ai_detect_duplicates
 
@@ -696,26 +825,31 @@ async def detect_duplicates_endpoint(request: DuplicateDetectionRequest):
         )
 
 
+# Static metadata responses, encoded once at import time
+_OBJECT_TYPES_JSON = orjson.dumps({
+    "object_types": [
+        {"id": "company", "name": "회사", "description": "회사/조직 데이터"},
+        {"id": "people", "name": "고객", "description": "고객/연락처 데이터"},
+        {"id": "lead", "name": "리드", "description": "리드 데이터 (고객 또는 회사 연결 필수)"},
+        {"id": "deal", "name": "딜", "description": "딜/거래 데이터 (고객 또는 회사 연결 필수)"},
+    ]
+})
+_CRM_FIELDS_JSON = {obj_type: orjson.dumps(fields) for obj_type, fields in OBJECT_FIELDS.items()}
+
+
 @router.get("/object-types")
-def get_object_types():
+async def get_object_types():
     """Get available object types for import"""
-    return {
-        "object_types": [
-            {"id": "company", "name": "회사", "description": "회사/조직 데이터"},
-            {"id": "people", "name": "고객", "description": "고객/연락처 데이터"},
-            {"id": "lead", "name": "리드", "description": "리드 데이터 (고객 또는 회사 연결 필수)"},
-            {"id": "deal", "name": "딜", "description": "딜/거래 데이터 (고객 또는 회사 연결 필수)"},
-        ]
-    }
+    return Response(content=_OBJECT_TYPES_JSON, media_type="application/json")
 
 
 @router.get("/crm-fields/{object_type}")
-def get_crm_fields(object_type: str):
+async def get_crm_fields(object_type: str):
     """Get CRM fields for a specific object type"""
-    if object_type not in OBJECT_FIELDS:
+    if object_type not in _CRM_FIELDS_JSON:
         raise HTTPException(status_code=400, detail="잘못된 오브젝트 타입입니다")
 
-    return OBJECT_FIELDS[object_type]
+    return Response(content=_CRM_FIELDS_JSON[object_type], media_type="application/json")
 
 
 # ============================================
@@ -724,6 +858,36 @@ def get_crm_fields(object_type: str):
 
 from app.services.salesmap_service import validate_api_key, fetch_object_fields
 from app.services.ai_service import consulting_chat
+from app.services.ttl_cache import TTLCache
+import hashlib
+
+# Short-lived cache of Salesmap API responses; the import wizard asks for
+# the same key/fields repeatedly while the user steps through it
+SALESMAP_CACHE_TTL = 60
+SALESMAP_CACHE_MAX_SIZE = 256
+
+_salesmap_cache = TTLCache(SALESMAP_CACHE_TTL, SALESMAP_CACHE_MAX_SIZE)
+
+
+def _api_key_hash(api_key: str) -> str:
+    """Hash the API key so raw keys are not kept in memory as cache keys"""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+
+async def _cached_salesmap_call(key: tuple, fetch, is_cacheable) -> dict:
+    """
+    Return a cached response if still fresh, otherwise call `fetch`.
+    Only responses accepted by `is_cacheable` are stored, so failures
+    (timeouts, invalid keys) are retried on the next request.
+    """
+    cached = _salesmap_cache.get(key)
+    if cached is not None:
+        return cached
+
+    result = await fetch()
+    if is_cacheable(result):
+        _salesmap_cache.set(key, result)
+    return result
 
 
 class ApiKeyValidationRequest(BaseModel):
@@ -770,7 +934,11 @@ async def validate_salesmap_key(request: ApiKeyValidationRequest):
     """
     print(f"[Route] /salesmap/validate-key 호출됨")
     print(f"[Route] API Key 길이: {len(request.api_key)}")
-    result = await validate_api_key(request.api_key)
+    result = await _cached_salesmap_call(
+        ("validate", _api_key_hash(request.api_key)),
+        lambda: validate_api_key(request.api_key),
+        lambda r: r.get("valid", False),
+    )
     print(f"[Route] 결과: {result}")
     return ApiKeyValidationResponse(
         valid=result["valid"],
@@ -786,9 +954,21 @@ async def fetch_salesmap_fields(request: FetchFieldsRequest):
     print(f"[Route] /salesmap/fetch-fields 호출됨")
     print(f"[Route] Object Types: {request.object_types}")
     results = []
+    key_hash = _api_key_hash(request.api_key)
+
+    # Fetch all object types concurrently (latency is max-of, not sum-of)
+    fetched = await asyncio.gather(*[
+        _cached_salesmap_call(
+            ("fields", key_hash, obj_type),
+            lambda obj_type=obj_type: fetch_object_fields(request.api_key, obj_type),
+            lambda r: r.get("success", False),
+        )
+        for obj_type in request.object_types
+    ], return_exceptions=True)
 
-    for obj_type in request.object_types:
-        result = await fetch_object_fields(request.api_key, obj_type)
+    for obj_type, result in zip(request.object_types, fetched):
+        if isinstance(result, Exception):
+            result = {"success": False, "error": f"필드 조회 오류: {str(result)}", "fields": []}
 
         fields = [
             FieldInfo(
@@ -2,6 +2,7 @@
 Salesmap API Router
 세일즈맵 API 프록시 및 연동 기능
 """
+import asyncio
 import httpx
 from typing import Optional, Any
 from fastapi import APIRouter, HTTPException, Header
@@ -13,7 +14,7 @@ from app.services.salesmap_service import (
     fetch_all_products,
     OBJECT_NAMES_KR,
 )
-from app.services.ai_service import get_openai_client
+from app.services.ai_service import OPENAI_MAP_MODEL, get_openai_client
 from app.services.import_history_service import (
     create_session,
     log_row_result,
@@ -105,10 +106,16 @@ async def fetch_fields(request: FetchFieldsRequest) -> FetchFieldsResponse:
     try:
         results = []
 
-        for obj_type in request.object_types:
-            print(f"[fetch-fields] Fetching fields for: {obj_type}")
+        print(f"[fetch-fields] Fetching fields for: {request.object_types}")
+        # 오브젝트별 필드 조회를 동시에 실행
+        fetched = await asyncio.gather(*[
+            fetch_object_fields(request.api_key, obj_type)
+            for obj_type in request.object_types
+        ], return_exceptions=True)
 
-            result = await fetch_object_fields(request.api_key, obj_type)
+        for obj_type, result in zip(request.object_types, fetched):
+            if isinstance(result, Exception):
+                result = {"success": False, "error": f"필드 조회 오류: {str(result)}", "fields": []}
 
             print(f"[fetch-fields] {obj_type} result: success={result.get('success')}, fields={len(result.get('fields', []))}")
 
@@ -658,8 +665,8 @@ async def auto_mapping(request: AutoMappingRequest) -> AutoMappingResponse:
 모든 소스 컬럼에 대해 매핑 결과를 반환하세요. JSON만 응답하세요."""
 
         openai_client = get_openai_client()
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
+        response = await openai_client.chat.completions.create(
+            model=OPENAI_MAP_MODEL,
             messages=[
                 {"role": "system", "content": "You are a CRM data mapping expert. Return only JSON."},
                 {"role": "user", "content": prompt}
@@ -1,26 +1,33 @@
+import asyncio
+import os
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from app.services.file_parser import parse_file
 
 router = APIRouter()
 
+ALLOWED_EXTENSIONS = (".csv", ".xlsx", ".xls")
+_ALLOWED_EXTENSION_SET = frozenset(ALLOWED_EXTENSIONS)
+
 
 @router.post("/upload")
 async def upload_file(file: UploadFile = File(...)):
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file provided")
 
-    allowed_extensions = [".csv", ".xlsx", ".xls"]
-    file_ext = "." + file.filename.split(".")[-1].lower()
+    # splitext returns "" for names without an extension, which is rejected
+    file_ext = os.path.splitext(file.filename)[1].lower()
 
-    if file_ext not in allowed_extensions:
+    if file_ext not in _ALLOWED_EXTENSION_SET:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
+            detail=f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
         )
 
     try:
-        contents = await file.read()
-        result = parse_file(contents, file_ext)
+        # The upload is already spooled to a temp file; parse it in place
+        # (in a worker thread) instead of copying the whole body into memory
+        await file.seek(0)
+        result = await asyncio.to_thread(parse_file, file.file, file_ext)
 
         return {
             "filename": file.filename,
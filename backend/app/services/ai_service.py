@@ -1,25 +1,126 @@
+import asyncio
 import os
-import json
 import re
-from openai import OpenAI
+from openai import AsyncOpenAI
+from collections.abc import Hashable
 from typing import Optional
-from difflib import SequenceMatcher
 from datetime import datetime
+import numpy as np
+import orjson
+from rapidfuzz import fuzz, process
+
+from app.services.llm_cache import LLM_CACHE_TTL, cache_key, get_cached, set_cached
+
+# Model for open-ended tasks (consulting chat, data quality review)
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+# Model for mechanical JSON tasks (field auto-mapping, duplicate review);
+# can be pointed at a smaller/cheaper model independently
+OPENAI_MAP_MODEL = os.getenv("OPENAI_MAP_MODEL", OPENAI_MODEL)
+
+# Retries for transient failures (connection errors, 408/409/429, 5xx);
+# the SDK backs off exponentially with jitter and honors Retry-After
+OPENAI_MAX_RETRIES = 4
 
 # Initialize OpenAI client
-client: Optional[OpenAI] = None
+client: Optional[AsyncOpenAI] = None
 
 
-def get_openai_client() -> OpenAI:
+def get_openai_client() -> AsyncOpenAI:
     global client
     if client is None:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable is not set")
-        client = OpenAI(api_key=api_key)
+        client = AsyncOpenAI(api_key=api_key, max_retries=OPENAI_MAX_RETRIES)
     return client
 
 
+def _to_json(value, indent: bool = False) -> str:
+    """Serialize prompt content with orjson (UTF-8, optional 2-space indent)."""
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(value, option=option).decode()
+
+
+async def _chat_completion(*, cache: bool = False, **request) -> str:
+    """
+    Call chat.completions.create and return the message content.
+    With cache=True the response is stored by a hash of the request, so
+    identical prompts (re-uploaded files, repeated duplicate cases) skip the
+    API call. Only deterministic, low-temperature tasks opt in; chat replies
+    are never cached. The SQLite lookups run in a worker thread.
+    """
+    key = None
+    if cache and LLM_CACHE_TTL > 0:
+        key = cache_key(**request)
+        cached = await asyncio.to_thread(get_cached, key)
+        if cached is not None:
+            return cached
+
+    response = await get_openai_client().chat.completions.create(**request)
+    content = response.choices[0].message.content
+    if key is not None and content:
+        await asyncio.to_thread(set_cached, key, content)
+    return content
+
+
+# Column type detection patterns (compiled once)
+_EMAIL_RE = re.compile(r'^[\w\.-]+@[\w\.-]+\.\w+$')
+_PHONE_RE = re.compile(r'^[\d\-\+\(\)\s]{8,}$')
+_URL_RE = re.compile(r'^https?://')
+_NUMBER_RE = re.compile(r'^-?[\d,]+\.?\d*$')
+_BOOL_PATTERNS = frozenset({'true', 'false', 'yes', 'no', '예', '아니오', 'y', 'n', '1', '0', 'o', 'x'})
+# Alternatives are joined into one pattern so each value is scanned once
+_DATE_RE = re.compile('|'.join([
+    r'^\d{4}[-/]\d{1,2}[-/]\d{1,2}$',  # 2024-01-15
+    r'^\d{1,2}[-/]\d{1,2}[-/]\d{4}$',  # 15-01-2024
+    r'^\d{4}년\s*\d{1,2}월\s*\d{1,2}일$',  # 2024년 1월 15일
+]))
+_DATETIME_RE = re.compile('|'.join([
+    r'^\d{4}[-/]\d{1,2}[-/]\d{1,2}\s+\d{1,2}:\d{2}',  # 2024-01-15 14:30
+    r'^\d{4}[-/]\d{1,2}[-/]\d{1,2}T\d{1,2}:\d{2}',  # 2024-01-15T14:30
+]))
+
+
+# Format checks in detection priority order; "number" ignores thousands separators
+_FORMAT_PATTERNS = (
+    ("email", _EMAIL_RE),
+    ("phone", _PHONE_RE),
+    ("url", _URL_RE),
+    ("datetime", _DATETIME_RE),
+    ("date", _DATE_RE),
+    ("number", _NUMBER_RE),
+)
+
+
+def _matching_formats(values) -> set[str]:
+    """
+    Names of the formats in _FORMAT_PATTERNS that every value matches.
+    All formats are checked in one pass; a format is dropped at its first
+    miss and the scan stops once none are left.
+    """
+    candidates = list(_FORMAT_PATTERNS)
+    values = iter(values)
+    for v in values:
+        plain = v.replace(',', '') if ',' in v else v
+        candidates = [
+            (name, pattern) for name, pattern in candidates
+            if pattern.match(plain if name == "number" else v) is not None
+        ]
+        if len(candidates) <= 1:
+            break
+
+    # Usual case: one format is left after the first few values, so the rest
+    # is a plain scan with a single pattern
+    if len(candidates) == 1:
+        name, pattern = candidates[0]
+        match = pattern.match
+        strip_commas = name == "number"
+        for v in values:
+            if match(v.replace(',', '') if strip_commas else v) is None:
+                return set()
+    return {name for name, _ in candidates}
+
+
 def analyze_column_types(data: list[dict], columns: list[str]) -> dict:
     """
     Analyze columns in the data to detect the most appropriate field type.
@@ -40,75 +141,67 @@ def analyze_column_types(data: list[dict], columns: list[str]) -> dict:
     result = {}
 
     for col in columns:
-        values = [row.get(col) for row in data if row.get(col) is not None and str(row.get(col)).strip()]
+        # Stripped, non-empty values (one lookup and one str() per cell)
+        str_values = [
+            stripped for row in data
+            if (value := row.get(col)) is not None and (stripped := str(value).strip())
+        ]
 
-        if not values:
+        if not str_values:
             result[col] = {"type": "text", "reason": "빈 값", "unique_count": 0, "sample_values": []}
             continue
 
-        str_values = [str(v).strip() for v in values]
         unique_values = list(set(str_values))
         unique_count = len(unique_values)
         total_count = len(str_values)
         sample_values = unique_values[:5]
 
+        # Every check below is all()/any() over the values, so it is evaluated
+        # on the distinct values only
+        formats = _matching_formats(unique_values)
+
         # Initialize detection flags
         detected_type = "text"
         reason = "기본 텍스트"
 
         # Check for boolean
-        bool_patterns = {'true', 'false', 'yes', 'no', '예', '아니오', 'y', 'n', '1', '0', 'o', 'x'}
-        lower_values = [v.lower() for v in str_values]
-        if unique_count <= 2 and all(v in bool_patterns for v in lower_values):
+        if unique_count <= 2 and all(v.lower() in _BOOL_PATTERNS for v in unique_values):
             detected_type = "boolean"
             reason = f"True/False 형태의 값 (고유값 {unique_count}개)"
 
         # Check for email
-        elif all(re.match(r'^[\w\.-]+@[\w\.-]+\.\w+$', v) for v in str_values):
+        elif "email" in formats:
             detected_type = "email"
             reason = "이메일 형식"
 
         # Check for phone number
-        elif all(re.match(r'^[\d\-\+\(\)\s]{8,}$', v) for v in str_values):
+        elif "phone" in formats:
             detected_type = "phone"
             reason = "전화번호 형식"
 
         # Check for URL
-        elif all(re.match(r'^https?://', v) for v in str_values):
+        elif "url" in formats:
             detected_type = "url"
             reason = "URL 형식"
 
         # Check for date/datetime
         else:
-            date_patterns = [
-                r'^\d{4}[-/]\d{1,2}[-/]\d{1,2}$',  # 2024-01-15
-                r'^\d{1,2}[-/]\d{1,2}[-/]\d{4}$',  # 15-01-2024
-                r'^\d{4}년\s*\d{1,2}월\s*\d{1,2}일$',  # 2024년 1월 15일
-            ]
-            datetime_patterns = [
-                r'^\d{4}[-/]\d{1,2}[-/]\d{1,2}\s+\d{1,2}:\d{2}',  # 2024-01-15 14:30
-                r'^\d{4}[-/]\d{1,2}[-/]\d{1,2}T\d{1,2}:\d{2}',  # 2024-01-15T14:30
-            ]
-
-            is_datetime = all(any(re.match(p, v) for p in datetime_patterns) for v in str_values)
-            is_date = all(any(re.match(p, v) for p in date_patterns) for v in str_values)
-
-            if is_datetime:
+            if "datetime" in formats:
                 detected_type = "datetime"
                 reason = "날짜+시간 형식"
-            elif is_date:
+            elif "date" in formats:
                 detected_type = "date"
                 reason = "날짜 형식"
 
             # Check for number
-            elif all(re.match(r'^-?[\d,]+\.?\d*$', v.replace(',', '')) for v in str_values):
+            elif "number" in formats:
                 detected_type = "number"
                 reason = "숫자 형식"
 
             # Check for select/multiselect (limited unique values)
             elif unique_count <= 10 and unique_count < total_count * 0.3:
                 # Check if values contain comma (multiselect)
-                if any(',' in v for v in str_values):
+                if any(',' in v for v in unique_values):
                     detected_type = "multiselect"
                     reason = f"복수 선택 가능 (고유값 {unique_count}개, 쉼표로 구분된 값 포함)"
                 else:
@@ -116,9 +209,9 @@ def analyze_column_types(data: list[dict], columns: list[str]) -> dict:
                     reason = f"제한된 선택 옵션 (고유값 {unique_count}개 / 전체 {total_count}개)"
 
             # Check for multiselect (comma-separated values)
-            elif any(',' in v for v in str_values):
+            elif any(',' in v for v in unique_values):
                 split_values = []
-                for v in str_values:
+                for v in unique_values:
                     split_values.extend([x.strip() for x in v.split(',')])
                 split_unique = len(set(split_values))
                 if split_unique <= 20:
@@ -136,6 +229,45 @@ def analyze_column_types(data: list[dict], columns: list[str]) -> dict:
     return result
 
 
+_THINKING_RE = re.compile(r'<thinking>(.*?)</thinking>', re.DOTALL)
+
+
+# Characters that matter for finding JSON object boundaries
+_JSON_SCAN_RE = re.compile(r'[{}"\\]')
+
+
+def _json_object_blocks(text: str):
+    """
+    Yield top-level {...} blocks of `text` in order.
+    Single linear scan tracking brace depth; braces inside JSON strings
+    (including escaped quotes) are ignored.
+    """
+    depth = 0
+    start = 0
+    in_string = False
+    skip = -1
+    for match in _JSON_SCAN_RE.finditer(text):
+        i = match.start()
+        if i < skip:
+            continue
+        ch = text[i]
+        if in_string:
+            if ch == '\\':
+                skip = i + 2  # escaped character
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = depth > 0
+        elif ch == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                yield text[start:i + 1]
+
+
 def parse_thinking_response(content: str) -> dict:
     """
     Parse AI response that contains <thinking> tags.
@@ -144,22 +276,20 @@ def parse_thinking_response(content: str) -> dict:
     thinking = ""
     result_content = content
 
-    # Extract thinking content
-    thinking_match = re.search(r'<thinking>(.*?)</thinking>', content, re.DOTALL)
+    # Extract thinking content (one scan; the block is cut out by slicing)
+    thinking_match = _THINKING_RE.search(content)
     if thinking_match:
         thinking = thinking_match.group(1).strip()
-        result_content = re.sub(r'<thinking>.*?</thinking>', '', content, flags=re.DOTALL).strip()
+        result_content = (content[:thinking_match.start()] + content[thinking_match.end():]).strip()
 
-    # Try to parse JSON from result
-    try:
-        # Find JSON in the result content
-        json_match = re.search(r'\{[\s\S]*\}', result_content)
-        if json_match:
-            result = json.loads(json_match.group())
-        else:
-            result = {}
-    except json.JSONDecodeError:
-        result = {}
+    # Parse the first top-level {...} block that is valid JSON
+    result = {}
+    for block in _json_object_blocks(result_content):
+        try:
+            result = orjson.loads(block)
+            break
+        except orjson.JSONDecodeError:
+            continue
 
     return {
         "thinking": thinking,
@@ -220,6 +350,37 @@ SALESMAP_FIELDS = {
 }
 
 
+# Prompt field options for the hardcoded schema, built once per object type
+SALESMAP_FIELD_OPTIONS = {
+    obj_type: [
+        {
+            "key": f"{obj_type}.{field['id']}",
+            "label": f"{obj_info['name']} - {field['label']}",
+            "description": field["description"]
+        }
+        for field in obj_info["fields"]
+    ]
+    for obj_type, obj_info in SALESMAP_FIELDS.items()
+}
+
+_field_options_json_cache: dict[tuple[str, ...], str] = {}
+
+
+def _salesmap_field_options_json(target_object_types: list[str]) -> str:
+    """Serialized field options for the given object types (cached per combination)."""
+    key = tuple(target_object_types)
+    cached = _field_options_json_cache.get(key)
+    if cached is None:
+        field_options = [
+            option
+            for obj_type in key
+            for option in SALESMAP_FIELD_OPTIONS.get(obj_type, ())
+        ]
+        cached = _to_json(field_options, indent=True)
+        _field_options_json_cache[key] = cached
+    return cached
+
+
 async def auto_map_fields(
     source_columns: list[str],
     sample_data: list[dict],
@@ -231,43 +392,35 @@ async def auto_map_fields(
     Returns mapping results with AI's reasoning process.
     """
     # Build field options for the prompt
-    field_options = []
-
     if available_fields:
-        for field_info in available_fields:
-            field_options.append({
+        field_options = [
+            {
                 "key": field_info.get("key", ""),
                 "label": field_info.get("label", ""),
                 "description": field_info.get("description", field_info.get("label", ""))
-            })
+            }
+            for field_info in available_fields
+        ]
+        field_options_json = _to_json(field_options, indent=True)
     else:
-        for obj_type in target_object_types:
-            if obj_type in SALESMAP_FIELDS:
-                obj_info = SALESMAP_FIELDS[obj_type]
-                for field in obj_info["fields"]:
-                    field_options.append({
-                        "key": f"{obj_type}.{field['id']}",
-                        "label": f"{obj_info['name']} - {field['label']}",
-                        "description": field["description"]
-                    })
-
-    # Prepare sample data for context
-    sample_str = ""
+        field_options_json = _salesmap_field_options_json(target_object_types)
+
+    # Prepare sample data for context (one lookup per cell, joined once)
+    preview_rows = sample_data[:5]
+    sample_lines = []
     for col in source_columns[:15]:
-        values = [str(row.get(col, ""))[:50] for row in sample_data[:5] if row.get(col)]
+        values = [str(value)[:50] for row in preview_rows if (value := row.get(col))]
         if values:
-            sample_str += f"- {col}: {', '.join(values)}\n"
+            sample_lines.append(f"- {col}: {', '.join(values)}\n")
+    sample_str = "".join(sample_lines)
 
+    # Stable instructions and target fields come first so repeated calls
+    # share a long identical prefix (OpenAI prompt caching); the per-upload
+    # columns and samples go last
     prompt = f"""당신은 CRM 데이터 매핑 전문가입니다. 사용자가 업로드한 파일의 컬럼을 Salesmap CRM 필드에 매핑해야 합니다.
 
-## 소스 컬럼 (업로드된 파일)
-{', '.join(source_columns)}
-
-## 샘플 데이터
-{sample_str}
-
 ## 타겟 CRM 필드
-{json.dumps(field_options, ensure_ascii=False, indent=2)}
+{field_options_json}
 
 ## 분석 과정
 각 컬럼을 분석하며 아래 과정을 <thinking> 태그 안에 상세히 작성하세요.
@@ -303,21 +456,26 @@ async def auto_map_fields(
   "reasoning": {{
     "소스컬럼명": "매핑 근거 한 줄 요약"
   }}
-}}"""
+}}
+
+## 소스 컬럼 (업로드된 파일)
+{', '.join(source_columns)}
+
+## 샘플 데이터
+{sample_str}"""
 
     try:
-        openai_client = get_openai_client()
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
+        content = await _chat_completion(
+            model=OPENAI_MAP_MODEL,
             messages=[
                 {"role": "system", "content": "You are a CRM data mapping expert. First show your thinking process in <thinking> tags, then provide the JSON result."},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.2,
-            max_tokens=4000
+            max_tokens=4000,
+            cache=True
         )
 
-        content = response.choices[0].message.content
         parsed = parse_thinking_response(content)
 
         result = parsed["result"]
@@ -329,13 +487,8 @@ async def auto_map_fields(
         return {"mappings": {}, "confidence": {}, "error": str(e)}
 
 
-def similarity_ratio(a: str, b: str) -> float:
-    """Calculate similarity ratio between two strings."""
-    if not a or not b:
-        return 0.0
-    a_lower = str(a).lower().strip()
-    b_lower = str(b).lower().strip()
-    return SequenceMatcher(None, a_lower, b_lower).ratio()
+# Rows scored per band in detect_duplicates
+DUPLICATE_BAND_ROWS = 512
 
 
 async def detect_duplicates(
@@ -345,6 +498,19 @@ async def detect_duplicates(
 ) -> list[dict]:
     """
     Detect potential duplicate records in the data using string similarity.
+    The CPU-bound scoring runs in a worker thread so the event loop stays free.
+    """
+    return await asyncio.to_thread(_detect_duplicates_sync, data, field_mappings, threshold)
+
+
+def _detect_duplicates_sync(
+    data: list[dict],
+    field_mappings: list[dict],
+    threshold: float
+) -> list[dict]:
+    """
+    Pairwise scores for each key field come from rapidfuzz cdist,
+    and the weighted average/threshold is computed with NumPy.
     """
     duplicates = []
 
@@ -356,66 +522,96 @@ async def detect_duplicates(
         if any(x in target for x in ["name", "email"]):
             key_fields.append({"source": source, "target": target, "weight": 1.0 if "email" in target else 0.8})
 
-    if not key_fields:
+    if not key_fields or len(data) < 2:
         return []
 
-    # Compare each pair of rows
-    checked_pairs = set()
-
-    for i, row1 in enumerate(data):
-        for j, row2 in enumerate(data):
-            if i >= j:
-                continue
-
-            pair_key = (min(i, j), max(i, j))
-            if pair_key in checked_pairs:
-                continue
-            checked_pairs.add(pair_key)
-
-            # Calculate weighted similarity
-            total_similarity = 0
-            total_weight = 0
-            field_similarities = {}
-
-            for field_info in key_fields:
-                source = field_info["source"]
-                weight = field_info["weight"]
-
-                val1 = row1.get(source, "")
-                val2 = row2.get(source, "")
-
-                if val1 and val2:
-                    sim = similarity_ratio(val1, val2)
-                    field_similarities[source] = sim
-                    total_similarity += sim * weight
-                    total_weight += weight
-
-            if total_weight > 0:
-                avg_similarity = total_similarity / total_weight
-
-                if avg_similarity >= threshold:
-                    duplicates.append({
-                        "row1": i + 1,
-                        "row2": j + 1,
-                        "similarity": round(avg_similarity, 2),
-                        "field_similarities": field_similarities,
-                        "data1": {k: str(v)[:50] for k, v in row1.items() if v},
-                        "data2": {k: str(v)[:50] for k, v in row2.items() if v}
-                    })
+    n = len(data)
+    total_weight = sum(field_info["weight"] for field_info in key_fields)
+    # Per-field column arrays: each distinct normalized value is stored
+    # once and rows refer to it by code
+    columns = []  # (source, weight, distinct values, value codes, non-empty mask, score cutoff)
+    for field_info in key_fields:
+        source = field_info["source"]
+        weight = field_info["weight"]
+        raw_values = [row.get(source, "") for row in data]
+        present = np.fromiter((bool(v) for v in raw_values), dtype=bool, count=n)
+        value_index: dict[str, int] = {}
+        codes = np.fromiter(
+            (value_index.setdefault(str(v).lower().strip() if v else "", len(value_index)) for v in raw_values),
+            dtype=np.intp, count=n
+        )
+        # Lowest score this field can have in a pair that still reaches the
+        # threshold (every other field scoring 1.0); rapidfuzz exits early
+        # and reports 0 below it, which cannot change the result
+        cutoff = max(0.0, 1 - (1 - threshold) * total_weight / weight) * 100 - 1e-6
+        columns.append((source, weight, list(value_index), codes, present, max(cutoff, 0.0)))
+
+    # Score the upper triangle in row bands: rows [start, end) against
+    # rows [start, n), so memory stays O(band * n) and the lower triangle
+    # is never computed
+    for start in range(0, n - 1, DUPLICATE_BAND_ROWS):
+        end = min(start + DUPLICATE_BAND_ROWS, n - 1)
+        shape = (end - start, n - start)
+        weighted_sum = np.zeros(shape)
+        weight_sum = np.zeros(shape)
+        field_scores = []  # (source, distinct scores, row codes, column codes, non-empty mask)
+
+        for source, weight, distinct, codes, present, cutoff in columns:
+            # Both values must be non-empty for the field to count
+            both = np.logical_and.outer(present[start:end], present[start:])
+            # Score only the distinct values in this band, then expand to rows
+            row_codes, row_inverse = np.unique(codes[start:end], return_inverse=True)
+            col_codes, col_inverse = np.unique(codes[start:], return_inverse=True)
+            distinct_scores = process.cdist(
+                [distinct[c] for c in row_codes], [distinct[c] for c in col_codes],
+                scorer=fuzz.ratio, score_cutoff=cutoff, dtype=np.float64, workers=-1
+            )
+            distinct_scores /= 100.0
+
+            # Accumulate in place, only where both values are present
+            weighted = (distinct_scores * weight)[np.ix_(row_inverse, col_inverse)]
+            np.add(weighted_sum, weighted, out=weighted_sum, where=both)
+            np.add(weight_sum, weight, out=weight_sum, where=both)
+            field_scores.append((source, distinct_scores, row_inverse, col_inverse, both))
+
+        # Pairs with no comparable field divide 0/0 -> NaN, which never passes
+        with np.errstate(invalid="ignore", divide="ignore"):
+            avg = np.divide(weighted_sum, weight_sum, out=weighted_sum)
+            hits = np.argwhere(avg >= threshold)
+        # The band's leading square also holds the lower triangle; keep j > i
+        hits = hits[hits[:, 1] > hits[:, 0]]
+
+        for bi, bj in hits:
+            i, j = start + int(bi), start + int(bj)
+            field_similarities = {
+                source: float(scores[row_inverse[bi], col_inverse[bj]])
+                for source, scores, row_inverse, col_inverse, both in field_scores
+                if both[bi, bj]
+            }
+            duplicates.append({
+                "row1": i + 1,
+                "row2": j + 1,
+                "similarity": round(float(avg[bi, bj]), 2),
+                "field_similarities": field_similarities,
+            })
 
     duplicates.sort(key=lambda x: x["similarity"], reverse=True)
-    return duplicates[:50]
-
-
-async def consulting_chat(
-    messages: list[dict],
-    is_summary_request: bool = False,
-    file_context: dict = None
-) -> dict:
-    """
-    AI-powered consulting chat for B2B CRM data import.
-    """
-    system_prompt = """당신은 B2B CRM 데이터 관리 컨설턴트입니다.
+    duplicates = duplicates[:50]
+
+    # Row previews only for the returned pairs; each row is truncated once
+    previews: dict[int, dict] = {}
+    for dup in duplicates:
+        for key, row_number in (("data1", dup["row1"]), ("data2", dup["row2"])):
+            preview = previews.get(row_number)
+            if preview is None:
+                preview = {k: str(v)[:50] for k, v in data[row_number - 1].items() if v}
+                previews[row_number] = preview
+            dup[key] = preview
+    return duplicates
+
+
+# Static parts of the consulting chat system prompt
+CONSULTING_SYSTEM_PROMPT = """당신은 B2B CRM 데이터 관리 컨설턴트입니다.
 사용자가 세일즈맵(Salesmap)에 데이터를 임포트하려고 합니다.
 사용자의 비즈니스 유형과 데이터 관리 요구사항을 파악하여 적절한 오브젝트(회사, 고객, 리드, 딜)와 필드를 추천해주세요.
 
@@ -437,43 +633,7 @@ async def consulting_chat(
 - 친근하고 전문적인 톤으로 대화하세요
 - 한국어로 답변하세요"""
 
-    # Analyze column types if file context is provided
-    column_type_analysis = None
-    if file_context:
-        columns = file_context.get('columns', [])
-        sample_data = file_context.get('sample_data', [])
-        if columns and sample_data:
-            column_type_analysis = analyze_column_types(sample_data, columns)
-
-        file_info = f"""
-
-## 업로드된 파일 정보
-- 파일명: {file_context.get('filename', 'Unknown')}
-- 컬럼: {', '.join(file_context.get('columns', [])[:10])}
-- 총 행 수: {file_context.get('total_rows', 0)}
-- 샘플 데이터: {json.dumps(file_context.get('sample_data', [])[:3], ensure_ascii=False)}"""
-
-        if column_type_analysis:
-            file_info += f"""
-
-## 컬럼별 필드 유형 분석 결과
-{json.dumps(column_type_analysis, ensure_ascii=False, indent=2)}
-
-### 필드 유형 설명
-- text: 일반 텍스트
-- number: 숫자 (금액, 수량 등)
-- email: 이메일 주소
-- phone: 전화번호
-- date: 날짜 (YYYY-MM-DD)
-- datetime: 날짜+시간
-- url: URL 주소
-- select: 단일 선택 (제한된 옵션)
-- multiselect: 복수 선택 (쉼표로 구분)
-- boolean: True/False"""
-        system_prompt += file_info
-
-    if is_summary_request:
-        system_prompt += """
+CONSULTING_SUMMARY_PROMPT = """
 
 ## 요약 요청
 대화 내용을 바탕으로 다음 JSON 형식으로 추천을 생성하세요.
@@ -698,30 +858,76 @@ async def consulting_chat(
 
 JSON만 응답하세요."""
 
-    try:
-        openai_client = get_openai_client()
 
+async def consulting_chat(
+    messages: list[dict],
+    is_summary_request: bool = False,
+    file_context: dict = None
+) -> dict:
+    """
+    AI-powered consulting chat for B2B CRM data import.
+    """
+    prompt_parts = [CONSULTING_SYSTEM_PROMPT]
+    if is_summary_request:
+        prompt_parts.append(CONSULTING_SUMMARY_PROMPT)
+
+    # File context varies per upload, so it goes after the static rules to
+    # keep the prompt prefix identical across calls (OpenAI prompt caching)
+    column_type_analysis = None
+    if file_context:
+        columns = file_context.get('columns', [])
+        sample_data = file_context.get('sample_data', [])
+        if columns and sample_data:
+            column_type_analysis = await asyncio.to_thread(analyze_column_types, sample_data, columns)
+
+        prompt_parts.append(f"""
+
+## 업로드된 파일 정보
+- 파일명: {file_context.get('filename', 'Unknown')}
+- 컬럼: {', '.join(file_context.get('columns', [])[:10])}
+- 총 행 수: {file_context.get('total_rows', 0)}
+- 샘플 데이터: {_to_json(file_context.get('sample_data', [])[:3])}""")
+
+        if column_type_analysis:
+            prompt_parts.append(f"""
+
+## 컬럼별 필드 유형 분석 결과
+{_to_json(column_type_analysis, indent=True)}
+
+### 필드 유형 설명
+- text: 일반 텍스트
+- number: 숫자 (금액, 수량 등)
+- email: 이메일 주소
+- phone: 전화번호
+- date: 날짜 (YYYY-MM-DD)
+- datetime: 날짜+시간
+- url: URL 주소
+- select: 단일 선택 (제한된 옵션)
+- multiselect: 복수 선택 (쉼표로 구분)
+- boolean: True/False""")
+
+    system_prompt = "".join(prompt_parts)
+
+    try:
         all_messages = [{"role": "system", "content": system_prompt}]
         all_messages.extend(messages)
 
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
+        content = await _chat_completion(
+            model=OPENAI_MODEL,
             messages=all_messages,
             temperature=0.7 if not is_summary_request else 0.3,
             response_format={"type": "json_object"} if is_summary_request else None
         )
 
-        content = response.choices[0].message.content
-
         if is_summary_request:
             try:
-                data = json.loads(content)
+                data = orjson.loads(content)
                 return {
                     "type": "summary",
                     "content": None,
                     "data": data
                 }
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 return {
                     "type": "message",
                     "content": content,
@@ -743,33 +949,11 @@ JSON만 응답하세요."""
         }
 
 
-async def ai_detect_duplicates(
-    data: list[dict],
-    field_mappings: list[dict],
-    threshold: float = 0.7
-) -> list[dict]:
-    """
-    Use AI with Chain-of-Thought to detect semantic duplicates.
-    Returns duplicate analysis with AI's reasoning process.
-    """
-    # First, run basic duplicate detection
-    basic_duplicates = await detect_duplicates(data, field_mappings, threshold=threshold)
+# Fixed instructions for AI duplicate review; shared by every batch so
+# only the cases differ between requests
+DUPLICATE_REVIEW_SYSTEM_PROMPT = """You are a data quality expert. First show your thinking process in <thinking> tags, then provide the JSON result.
 
-    if not basic_duplicates:
-        return []
-
-    # Use AI to analyze ambiguous cases
-    ambiguous_cases = [d for d in basic_duplicates if threshold <= d["similarity"] < 0.95]
-
-    if not ambiguous_cases:
-        return basic_duplicates
-
-    cases_for_ai = ambiguous_cases[:10]
-
-    prompt = f"""당신은 데이터 품질 전문가입니다.
-
-## 잠재적 중복 레코드
-{json.dumps(cases_for_ai, ensure_ascii=False, indent=2)}
+당신은 데이터 품질 전문가입니다. 사용자 메시지로 주어지는 잠재적 중복 레코드를 분석하세요.
 
 ## 중복 판단 과정
 각 후보 쌍에 대해 분석하세요.
@@ -779,10 +963,10 @@ async def ai_detect_duplicates(
 
 각 쌍에 대해:
 
-Row {{row1}} vs Row {{row2}}
+Row {row1} vs Row {row2}
 
 1. 필드별 비교:
-   - 이름: "{{name1}}" vs "{{name2}}" → 동일인/다른 사람/불확실
+   - 이름: "{name1}" vs "{name2}" → 동일인/다른 사람/불확실
    - 이메일: 도메인이 같은가? 아이디 패턴이 유사한가?
    - 회사: (주), 주식회사 등 변형 고려
 
@@ -803,62 +987,142 @@ Row {{row1}} vs Row {{row2}}
 </thinking>
 
 분석 완료 후 JSON 결과:
-{{
+{
   "analysis": [
-    {{
+    {
       "row1": number,
       "row2": number,
       "is_duplicate": true/false,
       "confidence": 0.0-1.0,
       "reason": "판단 근거 요약",
       "recommended_action": "merge/keep_separate/needs_review"
-    }}
+    }
   ],
-  "summary": {{
+  "summary": {
     "confirmed_duplicates": number,
     "likely_duplicates": number,
     "needs_review": number
-  }}
-}}"""
+  }
+}"""
 
-    try:
-        openai_client = get_openai_client()
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a data quality expert. First show your thinking process in <thinking> tags, then provide the JSON result."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2,
-            max_tokens=4000
-        )
+# Approximate prompt budget per duplicate review batch (~4 UTF-8 bytes per token)
+DUPLICATE_REVIEW_BATCH_TOKENS = 8000
+# Cases per batch; latency is dominated by output tokens, so several small
+# batches in parallel finish sooner than one large one
+DUPLICATE_REVIEW_BATCH_CASES = 4
+# Batches in flight at once, so large duplicate sets don't burst past
+# rate limits (each request also retries up to OPENAI_MAX_RETRIES times)
+DUPLICATE_REVIEW_CONCURRENCY = 4
 
-        content = response.choices[0].message.content
-        parsed = parse_thinking_response(content)
 
-        ai_result = parsed["result"]
-        thinking = parsed["thinking"]
+def _pack_duplicate_cases(cases: list[dict]) -> list[list[dict]]:
+    """
+    Group cases into batches of at most DUPLICATE_REVIEW_BATCH_CASES that
+    fit DUPLICATE_REVIEW_BATCH_TOKENS.
+    """
+    batches: list[list[dict]] = []
+    batch: list[dict] = []
+    batch_tokens = 0
+    for case in cases:
+        tokens = len(orjson.dumps(case, option=orjson.OPT_NON_STR_KEYS)) // 4
+        if batch and (
+            len(batch) >= DUPLICATE_REVIEW_BATCH_CASES
+            or batch_tokens + tokens > DUPLICATE_REVIEW_BATCH_TOKENS
+        ):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(case)
+        batch_tokens += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def _review_duplicate_batch(cases: list[dict]) -> dict:
+    """Ask the model to adjudicate one batch of duplicate candidates."""
+    content = await _chat_completion(
+        model=OPENAI_MAP_MODEL,
+        messages=[
+            {"role": "system", "content": DUPLICATE_REVIEW_SYSTEM_PROMPT},
+            {"role": "user", "content": f"## 잠재적 중복 레코드\n{_to_json(cases, indent=True)}"}
+        ],
+        temperature=0.2,
+        max_tokens=4000,
+        cache=True
+    )
+    return parse_thinking_response(content)
 
-        # Merge AI analysis with basic results
-        ai_analysis_map = {
-            (a["row1"], a["row2"]): a
-            for a in ai_result.get("analysis", [])
-        }
 
-        for dup in basic_duplicates:
-            key = (dup["row1"], dup["row2"])
-            if key in ai_analysis_map:
-                dup["ai_analysis"] = ai_analysis_map[key]
+async def ai_detect_duplicates(
+    data: list[dict],
+    field_mappings: list[dict],
+    threshold: float = 0.7
+) -> list[dict]:
+    """
+    Use AI with Chain-of-Thought to detect semantic duplicates.
+    Returns duplicate analysis with AI's reasoning process.
+    """
+    # First, run basic duplicate detection
+    basic_duplicates = await detect_duplicates(data, field_mappings, threshold=threshold)
+
+    if not basic_duplicates:
+        return []
 
-        # Add thinking to the first result for UI display
-        if basic_duplicates:
-            basic_duplicates[0]["ai_thinking"] = thinking
+    # Use AI to analyze ambiguous cases
+    ambiguous_cases = [d for d in basic_duplicates if threshold <= d["similarity"] < 0.95]
 
+    if not ambiguous_cases:
         return basic_duplicates
 
-    except Exception as e:
-        print(f"AI duplicate detection error: {e}")
-        return basic_duplicates
+    # Every ambiguous case is reviewed; batches run concurrently,
+    # at most DUPLICATE_REVIEW_CONCURRENCY at a time
+    batches = _pack_duplicate_cases(ambiguous_cases)
+    semaphore = asyncio.Semaphore(DUPLICATE_REVIEW_CONCURRENCY)
+
+    async def review_batch(batch: list[dict]) -> dict:
+        async with semaphore:
+            return await _review_duplicate_batch(batch)
+
+    reviews = await asyncio.gather(
+        *[review_batch(batch) for batch in batches],
+        return_exceptions=True
+    )
+
+    # Merge AI analysis with basic results
+    ai_analysis_map = {}
+    thinking_parts = []
+    reviewed = False
+    for review in reviews:
+        if isinstance(review, Exception):
+            print(f"AI duplicate detection error: {review}")
+            continue
+        reviewed = True
+        if review["thinking"]:
+            thinking_parts.append(review["thinking"])
+        # Model output is untrusted: skip anything that is not a list of
+        # objects keyed by hashable row numbers
+        result = review.get("result")
+        analysis = result.get("analysis") if isinstance(result, dict) else None
+        if not isinstance(analysis, list):
+            continue
+        for a in analysis:
+            if not isinstance(a, dict):
+                continue
+            key = (a.get("row1"), a.get("row2"))
+            if not all(isinstance(k, Hashable) for k in key):
+                continue
+            ai_analysis_map[key] = a
+
+    for dup in basic_duplicates:
+        key = (dup["row1"], dup["row2"])
+        if key in ai_analysis_map:
+            dup["ai_analysis"] = ai_analysis_map[key]
+
+    # Add thinking to the first result for UI display
+    if reviewed:
+        basic_duplicates[0]["ai_thinking"] = "\n\n".join(thinking_parts)
+
+    return basic_duplicates
 
 
 async def analyze_data_quality(
@@ -882,10 +1146,10 @@ async def analyze_data_quality(
 ## 데이터 개요
 - 총 행 수: {total_rows}
 - 오브젝트 유형: {', '.join(object_types)}
-- 매핑된 필드: {json.dumps(mapped_fields, ensure_ascii=False)}
+- 매핑된 필드: {_to_json(mapped_fields)}
 
 ## 샘플 데이터 (처음 10행)
-{json.dumps(sample_data, ensure_ascii=False, indent=2)}
+{_to_json(sample_data, indent=True)}
 
 ## 검증 과정
 
@@ -966,18 +1230,17 @@ Row by row 검사 (샘플 기준):
 }}"""
 
     try:
-        openai_client = get_openai_client()
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
+        content = await _chat_completion(
+            model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": "You are a data quality expert. First show your thinking process in <thinking> tags, then provide the JSON result."},
                 {"role": "user", "content": prompt}
             ],
             temperature=0.2,
-            max_tokens=4000
+            max_tokens=4000,
+            cache=True
         )
 
-        content = response.choices[0].message.content
         parsed = parse_thinking_response(content)
 
         result = parsed["result"]
@@ -2,12 +2,16 @@
 File Analyzer 서비스
 업로드된 파일 분석 및 컬럼 통계 생성
 """
-from typing import Optional
+from typing import Iterator, Optional
 from dataclasses import dataclass
 import re
 
+import pandas as pd
+
 from app.models.schemas import ColumnStats
-from app.models.salesmap import SKIP_COLUMN_PATTERNS, EMPTY_VALUES, is_value_empty
+from app.models.salesmap import EMPTY_VALUES, is_skip_column_name
+
+_EMPTY_VALUES_LIST = list(EMPTY_VALUES)
 
 
 @dataclass
@@ -50,10 +54,7 @@ class FileAnalyzer:
         total_rows = len(data)
 
         # 컬럼별 통계 계산
-        column_stats = []
-        for col in columns:
-            stats = self._analyze_column(data, col)
-            column_stats.append(stats)
+        column_stats = list(self.iter_column_stats(data))
 
         # 샘플 데이터
         sample_data = data[:sample_count]
@@ -65,34 +66,45 @@ class FileAnalyzer:
             sample_data=sample_data,
         )
 
-    def _analyze_column(self, data: list[dict], column: str) -> ColumnStats:
+    def iter_column_stats(self, data: list[dict]) -> Iterator[ColumnStats]:
+        """
+        컬럼별 통계를 하나씩 생성 (스트리밍 응답용)
+
+        Args:
+            data: 파일 데이터 (dict 리스트)
+
+        Yields:
+            ColumnStats
+        """
+        if not data:
+            return
+
+        # 원본 값 그대로 유지하도록 object dtype 사용
+        columns = list(data[0].keys())
+        df = pd.DataFrame(data, columns=columns, dtype=object)
+        for col in columns:
+            yield self._analyze_column(df[col], col)
+
+    def _analyze_column(self, values: pd.Series, column: str) -> ColumnStats:
         """단일 컬럼 분석"""
-        values = [row.get(column) for row in data]
         total = len(values)
 
         # 빈 값 계산
-        empty_count = sum(1 for v in values if is_value_empty(v))
-        non_empty_count = total - empty_count
-
-        # 유니크 값 계산 (빈 값 제외)
-        non_empty_values = [str(v).strip() for v in values if not is_value_empty(v)]
-        unique_count = len(set(non_empty_values))
-
-        # 샘플 값 (처음 5개 비어있지 않은 값)
-        sample_values = []
-        seen = set()
-        for v in non_empty_values:
-            if v not in seen and len(sample_values) < 5:
-                sample_values.append(v)
-                seen.add(v)
-
-        return ColumnStats(
+        str_values = values.astype(str).str.strip()
+        empty_mask = values.isna() | str_values.isin(_EMPTY_VALUES_LIST) | (str_values == '')
+        non_empty_values = str_values[~empty_mask]
+        non_empty_count = len(non_empty_values)
+
+        # 유니크 값 및 샘플 값 (처음 5개 비어있지 않은 값)
+        unique_values = non_empty_values.drop_duplicates()
+
+        return ColumnStats.model_construct(
             column_name=column,
             total_rows=total,
             non_empty_count=non_empty_count,
-            empty_count=empty_count,
-            unique_count=unique_count,
-            sample_values=sample_values,
+            empty_count=total - non_empty_count,
+            unique_count=len(unique_values),
+            sample_values=unique_values.head(5).tolist(),
         )
 
     def detect_column_type(self, stats: ColumnStats) -> str:
@@ -148,12 +160,9 @@ class FileAnalyzer:
         Returns:
             (is_skip, reason): 제외 여부와 사유
         """
-        column = stats.column_name.lower()
-
         # 1. 내부 식별자 패턴 확인
-        for pattern in SKIP_COLUMN_PATTERNS:
-            if re.match(pattern, column, re.IGNORECASE):
-                return True, "내부 식별자"
+        if is_skip_column_name(stats.column_name):
+            return True, "내부 식별자"
 
         # 2. 빈 값만 있는지 확인
         if stats.non_empty_count == 0:
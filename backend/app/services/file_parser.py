@@ -1,11 +1,15 @@
 import pandas as pd
 from io import BytesIO
+from typing import BinaryIO, Union
 
 
-def parse_file(contents: bytes, file_ext: str) -> dict:
-    """Parse CSV or Excel file and return columns with preview data"""
+def parse_file(contents: Union[bytes, BinaryIO], file_ext: str) -> dict:
+    """
+    Parse CSV or Excel file and return columns with preview data.
+    `contents` is the raw bytes or a seekable binary file object.
+    """
 
-    buffer = BytesIO(contents)
+    buffer = BytesIO(contents) if isinstance(contents, bytes) else contents
 
     if file_ext == ".csv":
         df = pd.read_csv(buffer)
@@ -13,7 +13,12 @@ class OpenAIProvider(LLMProvider):
 
     def __init__(self, api_key: str, config: Optional[LLMConfig] = None):
         super().__init__(api_key, config)
-        self.client = AsyncOpenAI(api_key=api_key)
+        # SDK가 연결 오류/408/409/429/5xx를 지수 백오프로 재시도
+        self.client = AsyncOpenAI(
+            api_key=api_key,
+            max_retries=self.config.retry_count,
+            timeout=self.config.timeout,
+        )
 
     async def complete(
         self,
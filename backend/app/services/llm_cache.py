@@ -0,0 +1,71 @@
+"""
+LLM 응답 캐시
+요청(model, messages, 옵션)의 SHA256 해시를 키로 응답 본문을 SQLite에 저장.
+같은 파일을 다시 올리거나 같은 매핑/중복 검토 요청이 반복되면 API 호출 없이 응답을 재사용한다.
+
+프롬프트에 포함된 업로드 데이터(샘플 값, 중복 후보 레코드)가 응답과 함께 디스크에 남으므로
+LLM_CACHE_PATH(저장 위치)와 LLM_CACHE_TTL(보관 시간, 초; 0이면 캐시 비활성화)로 조정한다.
+"""
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Optional
+
+import orjson
+
+LLM_CACHE_PATH = os.getenv(
+    "LLM_CACHE_PATH", os.path.join(tempfile.gettempdir(), "llm_cache.sqlite3")
+)
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "86400"))
+
+_conn: Optional[sqlite3.Connection] = None
+_lock = threading.Lock()
+
+
+def _get_conn() -> sqlite3.Connection:
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(LLM_CACHE_PATH, check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache "
+            "(key TEXT PRIMARY KEY, content TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+    return _conn
+
+
+def cache_key(**request: Any) -> str:
+    """요청 파라미터로 캐시 키 생성"""
+    return hashlib.sha256(orjson.dumps(request, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def get_cached(key: str) -> Optional[str]:
+    """캐시된 응답 조회 (없거나 만료되면 None)"""
+    try:
+        with _lock:
+            row = _get_conn().execute(
+                "SELECT content FROM llm_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+    except sqlite3.Error as e:
+        print(f"[llm_cache] 조회 실패: {e}")
+        return None
+    return row[0] if row else None
+
+
+def set_cached(key: str, content: str, ttl: int = LLM_CACHE_TTL) -> None:
+    """응답 저장 (만료된 항목은 함께 정리)"""
+    now = time.time()
+    try:
+        with _lock:
+            conn = _get_conn()
+            with conn:
+                conn.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (now,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, content, expires_at) VALUES (?, ?, ?)",
+                    (key, content, now + ttl),
+                )
+    except sqlite3.Error as e:
+        print(f"[llm_cache] 저장 실패: {e}")
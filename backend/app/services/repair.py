@@ -2,15 +2,20 @@
 Repair Loop 서비스
 LLM 응답 검증 실패 시 자동 수정 요청
 """
+import asyncio
+import hashlib
 import json
 import logging
-from typing import TypeVar, Callable, Optional, Any
+from typing import TypeVar, Callable, Optional, Any, Awaitable
 from dataclasses import dataclass
 
+import orjson
+
 from app.models.schemas import (
     TriageResult, MappingResult, ValidationResult, ValidationErrorItem
 )
 from app.services.llm.base import LLMProvider, LLMResponse
+from app.services.ttl_cache import TTLCache
 from app.services.validator import triage_validator, mapping_validator
 
 logger = logging.getLogger(__name__)
@@ -19,6 +24,10 @@ T = TypeVar('T', TriageResult, MappingResult)
 
 MAX_REPAIR_ATTEMPTS = 2
 
+# 동일 요청 결과 캐시 (성공한 결과만, 초 단위 TTL)
+RESULT_CACHE_TTL = 600
+RESULT_CACHE_MAX_SIZE = 128
+
 
 @dataclass
 class RepairLoopResult:
@@ -54,6 +63,8 @@ async def run_with_repair_loop(
     """
     repair_history = []
     attempts = 0
+    # 시도 간 검증된 항목 재사용 (변경된 항목만 재검증)
+    validated_items: dict = {}
 
     # 최초 LLM 호출
     response = await llm.complete(system_prompt, user_prompt)
@@ -91,7 +102,9 @@ async def run_with_repair_loop(
             parsed_result = None
         else:
             # 검증 실행
-            parsed_result, validation = validator_func(parsed_json, **validator_args)
+            parsed_result, validation = validator_func(
+                parsed_json, prior=validated_items, **validator_args
+            )
 
         repair_history.append({
             "attempt": attempts,
@@ -149,6 +162,43 @@ async def run_with_repair_loop(
     )
 
 
+_result_cache = TTLCache(RESULT_CACHE_TTL, RESULT_CACHE_MAX_SIZE)
+_inflight: dict[str, asyncio.Task] = {}
+
+
+def _cache_key(*parts: Any) -> str:
+    """요청 입력으로 캐시 키 생성"""
+    return hashlib.sha256(orjson.dumps(parts, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+async def _run_cached(
+    key: str,
+    run: Callable[[], Awaitable[RepairLoopResult]],
+) -> RepairLoopResult:
+    """
+    캐시 조회 후 없으면 실행
+
+    같은 키로 동시에 들어온 요청은 하나의 LLM 호출 결과를 공유한다.
+    """
+    cached = _result_cache.get(key)
+    if cached is not None:
+        return cached
+
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(run())
+        _inflight[key] = task
+
+        def _done(t: asyncio.Task) -> None:
+            _inflight.pop(key, None)
+            if not t.cancelled() and t.exception() is None and t.result().success:
+                _result_cache.set(key, t.result())
+
+        task.add_done_callback(_done)
+
+    return await asyncio.shield(task)
+
+
 async def triage_with_repair(
     llm: LLMProvider,
     system_prompt: str,
@@ -167,13 +217,14 @@ async def triage_with_repair(
     Returns:
         RepairLoopResult with TriageResult
     """
-    return await run_with_repair_loop(
+    key = _cache_key("triage", llm.config.model, system_prompt, user_prompt, all_columns)
+    return await _run_cached(key, lambda: run_with_repair_loop(
         llm=llm,
         system_prompt=system_prompt,
         user_prompt=user_prompt,
         validator_func=triage_validator.validate,
         validator_args={"all_columns": all_columns},
-    )
+    ))
 
 
 async def mapping_with_repair(
@@ -198,7 +249,11 @@ async def mapping_with_repair(
     Returns:
         RepairLoopResult with MappingResult
     """
-    return await run_with_repair_loop(
+    key = _cache_key(
+        "mapping", llm.config.model, system_prompt, user_prompt,
+        object_types, available_fields,
+    )
+    return await _run_cached(key, lambda: run_with_repair_loop(
         llm=llm,
         system_prompt=system_prompt,
         user_prompt=user_prompt,
@@ -208,4 +263,4 @@ async def mapping_with_repair(
             "object_types": object_types,
             "available_fields": available_fields,
         },
-    )
+    ))
@@ -0,0 +1,33 @@
+"""
+TTL 캐시
+만료 시간과 최대 크기가 있는 프로세스 내 dict 캐시.
+저장할 때 만료된 항목을 정리하고, 가득 차면 가장 오래된 항목부터 제거한다.
+"""
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """만료 시간(초)과 최대 항목 수가 있는 간단한 캐시"""
+
+    def __init__(self, ttl: float, max_size: int):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._items: dict[Hashable, tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 값 조회 (없거나 만료되면 None)"""
+        item = self._items.get(key)
+        if item and item[0] > time.monotonic():
+            return item[1]
+        return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """값 저장 (만료/초과 항목 정리)"""
+        now = time.monotonic()
+        for k in [k for k, (expires, _) in self._items.items() if expires <= now]:
+            del self._items[k]
+        self._items.pop(key, None)
+        while len(self._items) >= self.max_size:
+            del self._items[next(iter(self._items))]
+        self._items[key] = (now + self.ttl, value)
@@ -2,8 +2,9 @@
 Validator 서비스
 LLM 응답의 Pydantic 검증 및 비즈니스 규칙 검증
 """
-from typing import Optional
-from pydantic import ValidationError
+from typing import Any, Optional
+import orjson
+from pydantic import BaseModel, ValidationError
 
 from app.models.schemas import (
     TriageResult, MappingResult, ColumnKeep, ColumnSkip,
@@ -24,6 +25,61 @@ class ValidationError2(Exception):
         super().__init__(f"{len(errors)} validation errors")
 
 
+def _item_key(field: str, item: Any) -> Optional[tuple[str, bytes]]:
+    """원본 JSON 항목의 캐시 키"""
+    if not isinstance(item, dict):
+        return None
+    try:
+        return field, orjson.dumps(item, option=orjson.OPT_SORT_KEYS)
+    except TypeError:
+        return None
+
+
+def partial_validate(
+    data: dict,
+    fields: tuple[str, ...],
+    prior: Optional[dict[tuple[str, bytes], BaseModel]],
+) -> dict:
+    """
+    이전 Repair 시도에서 검증된 항목을 검증된 객체로 교체
+
+    LLM이 수정하지 않은 항목은 Pydantic 재검증 없이 그대로 사용되고,
+    변경된 항목만 다시 검증된다.
+    """
+    if not prior:
+        return data
+    partial = dict(data)
+    for field in fields:
+        items = data.get(field)
+        if isinstance(items, list):
+            partial[field] = [prior.get(_item_key(field, item), item) for item in items]
+    return partial
+
+
+def _remember_validated(
+    data: dict,
+    result: BaseModel,
+    fields: tuple[str, ...],
+    prior: Optional[dict[tuple[str, bytes], BaseModel]],
+) -> None:
+    """검증된 항목을 원본 JSON 기준으로 기록 (다음 Repair 시도에서 재사용)"""
+    if prior is None:
+        return
+    for field in fields:
+        items = data.get(field)
+        validated = getattr(result, field)
+        if not isinstance(items, list) or len(items) != len(validated):
+            continue
+        for item, obj in zip(items, validated):
+            key = _item_key(field, item)
+            if key is not None:
+                prior[key] = obj
+
+
+_TRIAGE_ITEM_FIELDS = ("columns_to_keep", "columns_to_skip")
+_MAPPING_ITEM_FIELDS = ("mappings",)
+
+
 class TriageValidator:
     """Triage 결과 검증기"""
 
@@ -31,6 +87,7 @@ class TriageValidator:
         self,
         data: dict,
         all_columns: list[str],
+        prior: Optional[dict[tuple[str, bytes], BaseModel]] = None,
     ) -> tuple[Optional[TriageResult], ValidationResult]:
         """
         Triage 결과 검증
@@ -38,6 +95,7 @@ class TriageValidator:
         Args:
             data: LLM 응답 JSON
             all_columns: 원본 파일의 전체 컬럼 목록
+            prior: 이전 시도에서 검증된 항목 (Repair Loop에서 전달)
 
         Returns:
             (TriageResult or None, ValidationResult)
@@ -47,7 +105,7 @@ class TriageValidator:
 
         # 1. Pydantic 스키마 검증
         try:
-            result = TriageResult(**data)
+            result = TriageResult(**partial_validate(data, _TRIAGE_ITEM_FIELDS, prior))
         except ValidationError as e:
             for err in e.errors():
                 errors.append(ValidationErrorItem(
@@ -61,6 +119,7 @@ class TriageValidator:
                 warnings=warnings,
                 stats={"pydantic_errors": len(errors)},
             )
+        _remember_validated(data, result, _TRIAGE_ITEM_FIELDS, prior)
 
         # 2. 배타적 분류 검증 (keep과 skip에 중복 없어야 함)
         keep_names = {c.column_name for c in result.columns_to_keep}
@@ -131,7 +190,8 @@ class TriageValidator:
         # 6. 필드 라벨 형식 검증 (영어 오브젝트명 허용: Lead, People, Organization, Deal)
         valid_prefixes = set(OBJECT_ENGLISH_NAMES.values())  # Lead, People, Organization, Deal
         for col in result.columns_to_keep:
-            if ' - ' not in col.suggested_field_label:
+            prefix, sep, _ = col.suggested_field_label.partition(' - ')
+            if not sep:
                 errors.append(ValidationErrorItem(
                     field=f"columns_to_keep.{col.column_name}.suggested_field_label",
                     message=f"'{col.suggested_field_label}' 형식 오류: '오브젝트 - 필드명' 형식 필요",
@@ -140,7 +200,6 @@ class TriageValidator:
                 ))
             else:
                 # 영어 오브젝트명 접두사 검증
-                prefix = col.suggested_field_label.split(' - ')[0]
                 if prefix not in valid_prefixes:
                     # 한글 접두사도 허용 (하위 호환)
                     korean_prefixes = {'고객', '회사', '조직', '딜', '리드'}
@@ -196,6 +255,7 @@ class MappingValidator:
         columns_to_keep: list[ColumnKeep],
         object_types: list[str],
         available_fields: dict[str, list[dict]],
+        prior: Optional[dict[tuple[str, bytes], BaseModel]] = None,
     ) -> tuple[Optional[MappingResult], ValidationResult]:
         """
         Mapping 결과 검증
@@ -205,6 +265,7 @@ class MappingValidator:
             columns_to_keep: Triage에서 유지하기로 한 컬럼
             object_types: 선택된 오브젝트 타입
             available_fields: 오브젝트별 사용 가능한 필드
+            prior: 이전 시도에서 검증된 항목 (Repair Loop에서 전달)
 
         Returns:
             (MappingResult or None, ValidationResult)
@@ -214,7 +275,7 @@ class MappingValidator:
 
         # 1. Pydantic 검증
         try:
-            result = MappingResult(**data)
+            result = MappingResult(**partial_validate(data, _MAPPING_ITEM_FIELDS, prior))
         except ValidationError as e:
             for err in e.errors():
                 errors.append(ValidationErrorItem(
@@ -227,6 +288,7 @@ class MappingValidator:
                 errors=errors,
                 warnings=warnings,
             )
+        _remember_validated(data, result, _MAPPING_ITEM_FIELDS, prior)
 
         # 2. 모든 유지 컬럼이 매핑되었는지 검증
         keep_column_names = {c.column_name for c in columns_to_keep}
@@ -255,7 +317,8 @@ class MappingValidator:
         valid_prefixes = set(OBJECT_ENGLISH_NAMES.values())  # Lead, People, Organization, Deal
         korean_prefixes = {'고객', '회사', '조직', '딜', '리드'}
         for mapping in result.mappings:
-            if ' - ' not in mapping.target_field_label:
+            prefix, sep, _ = mapping.target_field_label.partition(' - ')
+            if not sep:
                 errors.append(ValidationErrorItem(
                     field=f"mappings.{mapping.source_column}.target_field_label",
                     message=f"'{mapping.target_field_label}' 형식 오류",
@@ -263,7 +326,6 @@ class MappingValidator:
                     suggestion=f"'{get_object_english_name(mapping.target_object)} - 필드명' 형식으로 수정",
                 ))
             else:
-                prefix = mapping.target_field_label.split(' - ')[0]
                 if prefix not in valid_prefixes and prefix not in korean_prefixes:
                     errors.append(ValidationErrorItem(
                         field=f"mappings.{mapping.source_column}.target_field_label",
@@ -287,7 +349,7 @@ class MappingValidator:
 
         # 6. 필수 필드 매핑 검증
         for obj_type in object_types:
-            required = REQUIRED_FIELDS.get(obj_type, [])
+            required = REQUIRED_FIELDS.get(obj_type, frozenset())
             mapped_to_obj = [m for m in result.mappings if m.target_object == obj_type]
             mapped_field_ids = {m.target_field_id for m in mapped_to_obj if m.target_field_id}
 